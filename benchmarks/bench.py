@@ -0,0 +1,391 @@
+"""Benchmarks of pyblish_maya, against a synthetic stand-in for Maya
+
+Runs on plain Python, without Maya, using the stand-in package in
+./stub whose scene size is configurable. Results are stored as JSON,
+and compared between runs to flag regressions.
+
+Usage:
+    $ python benchmarks/bench.py run --output before.json
+    $ python benchmarks/bench.py run --nodes 100000 --selection 1000000
+    $ python benchmarks/bench.py run --cmds-overhead 20e-6 --only collect
+    $ python benchmarks/bench.py compare before.json after.json
+
+Compare exits with 1 if any benchmark is slower than the
+threshold, 10% by default, allows.
+
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import contextlib
+import timeit
+
+_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(_root, "stub"))
+sys.path.insert(0, os.path.dirname(_root))
+
+import maya
+import maya.cmds
+import maya.api.OpenMaya as om
+
+import pyblish.api
+import pyblish.util
+import pyblish_maya
+from pyblish_maya import lib
+
+_benchmarks = list()
+
+
+def benchmark(func):
+    """Register `func` as a benchmark
+
+    The function is called with the current scene, does any preparation
+    and returns a callable, the timing of which is the benchmark.
+
+    """
+
+    _benchmarks.append(func)
+    return func
+
+
+class _Null(object):
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Suppress the printing of setup() and friends"""
+    stdout, sys.stdout = sys.stdout, _Null()
+    try:
+        yield
+    finally:
+        sys.stdout = stdout
+
+
+def _context_plugin(name):
+    for Plugin in pyblish.api.discover():
+        if Plugin.__name__ == name:
+            return Plugin
+    raise ValueError("%s not found" % name)
+
+
+@benchmark
+def setup_teardown(scene):
+    def run():
+        lib.setup(menu=False)
+        lib.teardown()
+    return run
+
+
+@benchmark
+def register_plugins(scene):
+    def run():
+        lib.register_plugins()
+        lib.deregister_plugins()
+    return run
+
+
+@benchmark
+def collect_current_file(scene):
+    lib.setup(menu=False)
+    Plugin = _context_plugin("CollectMayaCurrentFile")
+
+    def run():
+        Plugin().process(pyblish.api.Context())
+    return run
+
+
+@benchmark
+def collect_current_file_invalidated(scene):
+    lib.setup(menu=False)
+    Plugin = _context_plugin("CollectMayaCurrentFile")
+
+    def run():
+        om.emit(om.MSceneMessage.kAfterOpen)
+        Plugin().process(pyblish.api.Context())
+    return run
+
+
+@benchmark
+def collect_workspace(scene):
+    lib.setup(menu=False)
+    Plugin = _context_plugin("CollectMayaWorkspace")
+
+    def run():
+        Plugin().process(pyblish.api.Context())
+    return run
+
+
+def _collect_instances_cmds(context):
+    """Baseline of CollectMayaInstances, querying each set via cmds"""
+    from maya import cmds
+
+    for name in cmds.ls(type="objectSet"):
+        if "id" not in (cmds.listAttr(name, userDefined=True) or []):
+            continue
+
+        if cmds.getAttr(name + ".id") != "pyblish.maya.instance":
+            continue
+
+        data = dict(
+            (attr, cmds.getAttr("%s.%s" % (name, attr)))
+            for attr in cmds.listAttr(name, userDefined=True)
+        )
+
+        instance = context.create_instance(data.pop("subset", name))
+        instance.data.update(data)
+        instance[:] = cmds.sets(name, query=True) or []
+
+
+@benchmark
+def collect_instances(scene):
+    lib.setup(menu=False)
+    Plugin = _context_plugin("CollectMayaInstances")
+
+    def run():
+        Plugin().process(pyblish.api.Context())
+    return run
+
+
+@benchmark
+def collect_instances_cmds(scene):
+    def run():
+        _collect_instances_cmds(pyblish.api.Context())
+    return run
+
+
+@benchmark
+def maintained_selection(scene):
+    def run():
+        with lib.maintained_selection():
+            pass
+    return run
+
+
+@benchmark
+def maintained_selection_api(scene):
+    def run():
+        with lib.maintained_selection(api=True):
+            pass
+    return run
+
+
+@benchmark
+def maintained_time(scene):
+    def run():
+        with lib.maintained_time():
+            pass
+    return run
+
+
+@benchmark
+def publish_performance(scene):
+    def run():
+        with lib.publish_performance(evaluation="off"):
+            pass
+    return run
+
+
+class _ValidateTranslate(pyblish.api.InstancePlugin):
+    """Validator querying each member, as validators typically do"""
+
+    order = pyblish.api.ValidatorOrder
+
+    def process(self, instance):
+        from maya import cmds
+
+        for member in instance:
+            cmds.getAttr(member + ".translateX")
+
+
+def _validate(revalidate):
+    lib.setup(menu=False, revalidate=revalidate)
+    pyblish.api.register_plugin(_ValidateTranslate)
+    plugins = pyblish.api.discover()
+
+    def run():
+        # Artist fixes one thing, and validates again
+        maya.cmds.setAttr("node0.translateX", 0.0)
+        context = pyblish.util.collect(plugins=plugins)
+        pyblish.util.validate(context, plugins=plugins)
+    return run
+
+
+@benchmark
+def validate(scene):
+    return _validate(revalidate=False)
+
+
+@benchmark
+def revalidate(scene):
+    return _validate(revalidate=True)
+
+
+@benchmark
+def discover_gui(scene):
+    # Last registered is tried first
+    for gui in ("pyblish_stubgui", "pyblish_missing_b", "pyblish_missing_a"):
+        pyblish.api.register_gui(gui)
+
+    def run():
+        lib._discover_gui()
+    return run
+
+
+def _reset():
+    lib.teardown()
+    pyblish.api.deregister_all_paths()
+    pyblish.api.deregister_all_hosts()
+    pyblish.api.deregister_all_plugins()
+
+    for gui in pyblish.api.registered_guis():
+        pyblish.api.deregister_gui(gui)
+
+
+def _time(func, repeat):
+    # Calibrate number of calls, such that each repeat takes ~50 ms
+    once = timeit.timeit(func, number=1)
+    number = max(1, int(0.05 / once)) if once else 1000
+
+    timings = sorted(
+        t / number for t in timeit.repeat(func, number=number, repeat=repeat)
+    )
+
+    return {
+        "min": timings[0],
+        "median": timings[len(timings) // 2],
+        "mean": sum(timings) / len(timings),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(nodes, sets, selection, repeat=5, only=None, overhead=0.0):
+    """Run benchmarks, returning results as a JSON-compatible dict"""
+    scene = maya.configure(nodes=nodes,
+                           sets=sets,
+                           selection=selection,
+                           overhead=overhead)
+
+    results = dict()
+    for func in _benchmarks:
+        name = func.__name__
+        if only and not any(pattern in name for pattern in only):
+            continue
+
+        with _quiet():
+            _reset()
+            try:
+                results[name] = _time(func(scene), repeat)
+            finally:
+                _reset()
+
+    return {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "version": pyblish_maya.version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "nodes": nodes,
+            "sets": sets,
+            "selection": selection,
+            "overhead": overhead,
+        },
+        "results": results,
+    }
+
+
+def compare(before, after, threshold=0.1):
+    """Return rows of (name, before, after, ratio, regressed)"""
+    rows = list()
+
+    for name in sorted(after["results"]):
+        if name not in before["results"]:
+            continue
+
+        old = before["results"][name]["median"]
+        new = after["results"][name]["median"]
+        ratio = new / old if old else 1.0
+
+        rows.append((name, old, new, ratio, ratio > 1 + threshold))
+
+    return rows
+
+
+def _format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return "%.2f %s" % (seconds * scale, unit)
+    return "%.2f ns" % (seconds * 1e9)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command")
+
+    run_parser = commands.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument("--nodes", type=int, default=1000)
+    run_parser.add_argument("--sets", type=int, default=10)
+    run_parser.add_argument("--selection", type=int, default=1000)
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--cmds-overhead", type=float, default=0.0,
+                            help="Seconds spent per maya.cmds call")
+    run_parser.add_argument("--only", nargs="*",
+                            help="Only run benchmarks matching these")
+    run_parser.add_argument("--output", help="Write results to this file")
+
+    compare_parser = commands.add_parser("compare",
+                                         help="Compare results of two runs")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Fraction slower counted as regression")
+
+    opts = parser.parse_args(argv)
+
+    if opts.command == "run":
+        results = run(opts.nodes, opts.sets, opts.selection,
+                      opts.repeat, opts.only, opts.cmds_overhead)
+
+        for name, result in sorted(results["results"].items()):
+            print("%-40s %12s" % (name, _format_seconds(result["median"])))
+
+        if opts.output:
+            with open(opts.output, "w") as f:
+                json.dump(results, f, indent=4, sort_keys=True)
+
+        return 0
+
+    if opts.command == "compare":
+        with open(opts.before) as f:
+            before = json.load(f)
+        with open(opts.after) as f:
+            after = json.load(f)
+
+        for key in ("nodes", "sets", "selection", "overhead"):
+            if before["meta"].get(key) != after["meta"].get(key):
+                print("Warning: Runs differ in %s (%s != %s)" % (
+                    key, before["meta"].get(key), after["meta"].get(key)))
+
+        rows = compare(before, after, opts.threshold)
+        for name, old, new, ratio, regressed in rows:
+            print("%-40s %12s %12s %7.2fx %s" % (
+                name, _format_seconds(old), _format_seconds(new),
+                ratio, "REGRESSION" if regressed else ""))
+
+        return 1 if any(row[-1] for row in rows) else 0
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""Synthetic stand-in for Maya, for benchmarking on plain Linux
+
+Only what pyblish_maya and its plug-ins use is simulated, backed by
+an in-memory scene whose size is configured via :func:`configure`,
+or the MAYASTUB_NODES, MAYASTUB_SETS, MAYASTUB_SELECTION and
+MAYASTUB_OVERHEAD environment variables for subprocesses.
+
+Example:
+    >>> import maya
+    >>> maya.configure(nodes=10000, sets=100, selection=100000)
+    >>> maya.configure(overhead=20e-6)  # Seconds per maya.cmds call
+
+"""
+
+import os
+
+from . import _scene
+
+
+def configure(nodes=None, sets=None, selection=None, overhead=None):
+    """Replace the current scene with one of the given size"""
+    if overhead is not None:
+        _scene.overhead = overhead
+
+    _scene.current = _scene.Scene(
+        nodes=nodes if nodes is not None else _scene.current.size[0],
+        sets=sets if sets is not None else _scene.current.size[1],
+        selection=(selection if selection is not None
+                   else _scene.current.size[2]),
+    )
+    return _scene.current
+
+
+_scene.current = _scene.Scene(
+    nodes=int(os.environ.get("MAYASTUB_NODES", 1000)),
+    sets=int(os.environ.get("MAYASTUB_SETS", 10)),
+    selection=int(os.environ.get("MAYASTUB_SELECTION", 100)),
+)
+_scene.overhead = float(os.environ.get("MAYASTUB_OVERHEAD", 0))
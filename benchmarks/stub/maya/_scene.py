@@ -0,0 +1,71 @@
+"""In-memory scene backing the stand-in commands"""
+
+import uuid
+
+
+class Scene(object):
+    """A scene of `nodes` transforms, `sets` object sets and a selection
+
+    Each set carries a few attributes, as a publish set would, and
+    an equal share of the nodes as members. The selection is made
+    up of `selection` vertices of the first node.
+
+    """
+
+    def __init__(self, nodes=1000, sets=10, selection=100):
+        self.size = (nodes, sets, selection)
+        self.fname = "/projects/stub/scenes/stub_v001.ma"
+        self.workspace = "/projects/stub/"
+        self.time = 1.0
+        self.range = (1.0, 100.0)
+        self.undo = True
+        self.suspended = False
+        self.evaluation = "parallel"
+
+        self.nodes = dict()
+        for index in range(nodes):
+            self.add_node("node%d" % index, "transform")
+
+        per_set = nodes // sets if sets else 0
+        for index in range(sets):
+            name = self.add_node("publish%d_SET" % index, "objectSet")
+            attrs = self.nodes[name]["attrs"]
+            attrs["id"] = "pyblish.maya.instance"
+            attrs["family"] = "model"
+            attrs["subset"] = "subset%d" % index
+            attrs["active"] = True
+            self.nodes[name]["dynamic"].extend(
+                ["id", "family", "subset", "active"])
+            self.nodes[name]["members"] = [
+                "node%d" % i
+                for i in range(index * per_set, (index + 1) * per_set)
+            ]
+
+        self.selection = [
+            "node0.vtx[%d]" % index for index in range(selection)
+        ]
+
+    def add_node(self, name, type):
+        self.nodes[name] = {
+            "type": type,
+            "uuid": str(uuid.uuid4()).upper(),
+            "attrs": {
+                "translateX": 0.0,
+                "translateY": 0.0,
+                "translateZ": 0.0,
+                "visibility": True,
+            },
+            "members": [],
+            "dynamic": [],
+        }
+        return name
+
+    def resolve(self, name):
+        """Return node of `name`, as Maya would on passing a name"""
+        return self.nodes.get(name.split(".", 1)[0])
+
+
+current = None
+
+# Seconds spent per command, see maya.cmds
+overhead = 0.0
@@ -0,0 +1,246 @@
+"""Stand-in maya.api.OpenMaya, operating on :mod:`maya._scene`"""
+
+from .. import _scene
+
+_callbacks = dict()
+
+
+def _add_callback(message, function, clientData=None):
+    id_ = len(_callbacks) + 1
+    while id_ in _callbacks:
+        id_ += 1
+
+    _callbacks[id_] = (message, function, clientData)
+    return id_
+
+
+def emit(message, *args):
+    """Simulate Maya sending `message`, such as MSceneMessage.kAfterOpen"""
+    for name, function, clientData in list(_callbacks.values()):
+        if name == message:
+            function(*(args + (clientData,)))
+
+
+def _attribute_set(node, attr):
+    """Notify of `attr` of `node` being set, as by maya.cmds.setAttr"""
+    emit(("nodeDirty", node), MObject(node))
+    emit(("attributeChanged", node),
+         MNodeMessage.kAttributeSet,
+         MPlug(MObject(node, attr)),
+         MPlug(MObject()))
+
+
+class MMessage(object):
+    @staticmethod
+    def removeCallback(id_):
+        del _callbacks[id_]
+
+    @staticmethod
+    def removeCallbacks(ids):
+        for id_ in ids:
+            del _callbacks[id_]
+
+
+class MSceneMessage(MMessage):
+    kAfterOpen = "kAfterOpen"
+    kAfterNew = "kAfterNew"
+    kAfterSave = "kAfterSave"
+
+    addCallback = staticmethod(_add_callback)
+
+
+class MEventMessage(MMessage):
+    addEventCallback = staticmethod(_add_callback)
+
+
+class MNodeMessage(MMessage):
+    kAttributeSet = 8
+
+    @staticmethod
+    def addNodeDirtyCallback(node, function, clientData=None):
+        return _add_callback(("nodeDirty", node.node), function, clientData)
+
+    @staticmethod
+    def addAttributeChangedCallback(node, function, clientData=None):
+        return _add_callback(("attributeChanged", node.node),
+                             function, clientData)
+
+
+class MDagMessage(MMessage):
+    @staticmethod
+    def addAllDagChangesCallback(function, clientData=None):
+        return _add_callback("allDagChanges", function, clientData)
+
+
+class MSelectionList(object):
+    def __init__(self, other=None):
+        self._items = list(other._items) if other is not None else []
+
+    def add(self, item):
+        self._items.append(item)
+        return self
+
+    def length(self):
+        return len(self._items)
+
+    def getSelectionStrings(self):
+        return list(self._items)
+
+    def getDependNode(self, index):
+        name = self._items[index]
+
+        if _scene.current.resolve(name) is None:
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+
+        return MObject(name.split(".", 1)[0])
+
+
+class MGlobal(object):
+    kReplaceList = 0
+    kAddToList = 1
+
+    @staticmethod
+    def getActiveSelectionList(orderedSelectionIfAvailable=False):
+        selection = MSelectionList()
+        selection._items = list(_scene.current.selection)
+        return selection
+
+    @staticmethod
+    def setActiveSelectionList(selection, listAdjustment=0):
+        # Held by reference, no names are resolved
+        _scene.current.selection = list(selection._items)
+
+
+class MFn(object):
+    kSet = "objectSet"
+    kTypedAttribute = "typed"
+    kNumericAttribute = "numeric"
+    kEnumAttribute = "enum"
+
+
+class MFnData(object):
+    kString = "string"
+
+
+class MFnNumericData(object):
+    kBoolean = bool
+    kByte = "byte"
+    kShort = "short"
+    kInt = int
+    kFloat = "float"
+    kDouble = float
+
+
+class MObject(object):
+    """Reference to a node, or to an attribute of a node"""
+
+    def __init__(self, node=None, attr=None):
+        self.node = node
+        self.attr = attr
+
+    def _value(self):
+        return _scene.current.nodes[self.node]["attrs"][self.attr]
+
+    def hasFn(self, fn):
+        value = self._value()
+
+        if fn == MFn.kTypedAttribute:
+            return isinstance(value, str)
+        if fn == MFn.kNumericAttribute:
+            return isinstance(value, (bool, int, float))
+        return False
+
+    def isNull(self):
+        return self.node is None
+
+
+class MPlug(object):
+    def __init__(self, obj):
+        self._obj = obj
+
+    def attribute(self):
+        return self._obj
+
+    def asString(self):
+        return str(self._obj._value())
+
+    def asBool(self):
+        return bool(self._obj._value())
+
+    def asInt(self):
+        return int(self._obj._value())
+
+    def asShort(self):
+        return int(self._obj._value())
+
+    def asDouble(self):
+        return float(self._obj._value())
+
+
+class MFnAttribute(object):
+    def __init__(self, obj):
+        self._obj = obj
+        self.name = obj.attr
+        self.dynamic = obj.attr in _scene.current.nodes[obj.node]["dynamic"]
+
+    def object(self):
+        return self._obj
+
+
+class MFnTypedAttribute(MFnAttribute):
+    def attrType(self):
+        return MFnData.kString
+
+
+class MFnNumericAttribute(MFnAttribute):
+    def numericType(self):
+        return type(self._obj._value())
+
+
+class MFnDependencyNode(object):
+    def __init__(self, obj):
+        self._obj = obj
+        self._node = _scene.current.nodes[obj.node]
+        self._attrs = list(self._node["attrs"])
+
+    def name(self):
+        return self._obj.node
+
+    def hasAttribute(self, name):
+        return name in self._node["attrs"]
+
+    def attributeCount(self):
+        return len(self._attrs)
+
+    def attribute(self, index):
+        return MObject(self._obj.node, self._attrs[index])
+
+    def findPlug(self, attr, wantNetworkedPlug):
+        if not isinstance(attr, MObject):
+            attr = MObject(self._obj.node, attr)
+        return MPlug(attr)
+
+
+class MFnSet(MFnDependencyNode):
+    def getMembers(self, flatten):
+        selection = MSelectionList()
+        selection._items = list(self._node["members"])
+        return selection
+
+
+class MItDependencyNodes(object):
+    def __init__(self, filter=None):
+        self._nodes = [
+            name for name, node in _scene.current.nodes.items()
+            if filter is None or node["type"] == filter
+        ]
+        self._index = 0
+
+    def isDone(self):
+        return self._index >= len(self._nodes)
+
+    def thisNode(self):
+        return MObject(self._nodes[self._index])
+
+    def next(self):
+        self._index += 1
@@ -0,0 +1,222 @@
+"""Stand-in maya.cmds, operating on :mod:`maya._scene`
+
+Each command costs at least `_scene.overhead` seconds, simulating
+the round-trip of parsing a command, its flags and its arguments.
+
+"""
+
+import time
+
+from . import _scene
+from .api import OpenMaya as _openmaya
+
+
+def _scene_():
+    return _scene.current
+
+
+def about(batch=False, **kwargs):
+    return True
+
+
+def file(path=None, sceneName=False, query=False, open=False,
+         force=False, prompt=True, new=False, newFile=False, **kwargs):
+    scene = _scene_()
+
+    if query and sceneName:
+        return scene.fname
+
+    if open:
+        scene.fname = path
+        return path
+
+    if new or newFile:
+        scene.fname = ""
+
+
+def flushUndo():
+    pass
+
+
+def workspace(rootDirectory=False, dir=False, query=False, **kwargs):
+    return _scene_().workspace
+
+
+def currentTime(time=None, query=False, edit=False, update=True, **kwargs):
+    scene = _scene_()
+
+    if query:
+        return scene.time
+
+    scene.time = float(time)
+    return scene.time
+
+
+def playbackOptions(minTime=False, maxTime=False, query=False, **kwargs):
+    scene = _scene_()
+    return scene.range[0] if minTime else scene.range[1]
+
+
+def currentUnit(time=False, linear=False, angle=False, query=False,
+                **kwargs):
+    if time:
+        return "film"
+    if linear:
+        return "cm"
+    return "deg"
+
+
+def ls(*names, **kwargs):
+    scene = _scene_()
+
+    if kwargs.get("selection") or kwargs.get("sl"):
+        return list(scene.selection)
+
+    type_ = kwargs.get("type")
+    nodes = names or sorted(scene.nodes)
+
+    if names and isinstance(names[0], (list, tuple)):
+        nodes = names[0]
+
+    nodes = [
+        name for name in nodes
+        if name in scene.nodes and (
+            type_ is None or scene.nodes[name]["type"] == type_
+        )
+    ]
+
+    if kwargs.get("uuid"):
+        return [scene.nodes[name]["uuid"] for name in nodes]
+
+    return nodes
+
+
+def select(items=None, replace=False, add=False, noExpand=False,
+           deselect=False, clear=False, **kwargs):
+    scene = _scene_()
+
+    if items is None:
+        if deselect or clear:
+            scene.selection = []
+        return
+
+    if not isinstance(items, (list, tuple)):
+        items = [items]
+
+    # Maya resolves each name passed
+    for name in items:
+        if scene.resolve(name) is None:
+            raise ValueError("No object matches name: %s" % name)
+
+    if deselect:
+        scene.selection = [s for s in scene.selection if s not in items]
+    elif add:
+        scene.selection += list(items)
+    else:
+        scene.selection = list(items)
+
+
+def undoInfo(query=False, state=False, stateWithoutFlush=None, **kwargs):
+    scene = _scene_()
+
+    if query:
+        return scene.undo
+
+    if stateWithoutFlush is not None:
+        scene.undo = stateWithoutFlush
+
+
+def refresh(suspend=None, query=False, **kwargs):
+    if query:
+        return _scene_().suspended
+
+    if suspend is not None:
+        _scene_().suspended = suspend
+
+
+def evaluationManager(query=False, mode=None, **kwargs):
+    scene = _scene_()
+
+    if query:
+        return [scene.evaluation]
+
+    if mode is not None:
+        scene.evaluation = mode
+
+
+def objExists(name):
+    return _scene_().resolve(name) is not None
+
+
+def nodeType(name):
+    return _scene_().resolve(name)["type"]
+
+
+def getAttr(plug, **kwargs):
+    node, attr = plug.split(".", 1)
+    return _scene_().nodes[node]["attrs"][attr]
+
+
+def setAttr(plug, value, **kwargs):
+    node, attr = plug.split(".", 1)
+    _scene_().nodes[node]["attrs"][attr] = value
+    _openmaya._attribute_set(node, attr)
+
+
+def listAttr(node, userDefined=False, **kwargs):
+    node = _scene_().nodes[node]
+
+    if userDefined:
+        return list(node["dynamic"]) or None
+
+    return list(node["attrs"])
+
+
+def sets(name=None, query=False, **kwargs):
+    if query:
+        return list(_scene_().nodes[name]["members"])
+
+
+def listRelatives(*args, **kwargs):
+    return None
+
+
+def listHistory(nodes, **kwargs):
+    return list(nodes)
+
+
+def listConnections(*args, **kwargs):
+    return []
+
+
+def menuItem(*args, **kwargs):
+    return False
+
+
+def deleteUI(*args, **kwargs):
+    pass
+
+
+def evalDeferred(*args, **kwargs):
+    pass
+
+
+def dockControl(*args, **kwargs):
+    return False
+
+
+def _round_trip(func):
+    def command(*args, **kwargs):
+        if _scene.overhead:
+            end = time.time() + _scene.overhead
+            while time.time() < end:
+                pass
+        return func(*args, **kwargs)
+
+    command.__name__ = func.__name__
+    return command
+
+
+for _name, _func in list(globals().items()):
+    if callable(_func) and not _name.startswith("_"):
+        globals()[_name] = _round_trip(_func)
@@ -0,0 +1,2 @@
+def eval(command):
+    pass
@@ -0,0 +1,5 @@
+"""Stand-in graphical user interface, registered via pyblish.api.register_gui"""
+
+
+def show(parent=None):
+    return parent
@@ -1,3 +1,6 @@
+import time as _time
+_import_start = _time.time()
+
 from .version import *
 
 from .lib import (
@@ -8,11 +11,17 @@ from .lib import (
     register_host,
     add_to_filemenu,
     dock,
+    timings,
 
     # Utility functions
-    maintained_selection
+    maintained_selection,
+    maintained_time,
+    publish_performance,
 )
 
+lib._timings["import"] = _time.time() - _import_start
+
+
 def is_setup():
     from . import lib
     return lib._has_been_setup
@@ -24,7 +33,9 @@ __all__ = [
     "register_plugins",
     "register_host",
     "add_to_filemenu",
+    "timings",
 
     "maintained_selection",
     "maintained_time",
+    "publish_performance",
 ]
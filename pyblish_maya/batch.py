@@ -0,0 +1,186 @@
+"""Publish many scenes in a single mayapy session
+
+Maya is initialised and plug-ins discovered once, after which each
+scene is opened, published and recorded in turn.
+
+Usage:
+    $ mayapy -m pyblish_maya.batch scene1.ma scene2.mb
+    $ mayapy -m pyblish_maya.batch --manifest scenes.txt --output results.jsonl
+
+A manifest is either a JSON list of paths, or a text file
+with one path per line. Lines starting with # are ignored.
+
+Each scene produces one JSON record, written as a line to `--output`,
+or standard out if no output is given. The duration of each scene is
+in seconds, as `duration_s`, and that of each of its results in
+milliseconds, as `duration_ms`, as measured by pyblish.
+
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import pyblish.api
+import pyblish.util
+
+from . import lib
+
+
+def initialize():
+    """Boot Maya, unless it is already running, and setup integration"""
+    from maya import cmds
+
+    # If cmds doesn't have any members, Maya is not yet initialised.
+    if not hasattr(cmds, "file"):
+        import maya.standalone
+        maya.standalone.initialize(name="python")
+
+    # Headless, nothing else relies on results once streamed
+    lib.setup(menu=False, trim=True)
+
+
+def read_manifest(fname):
+    """Return list of scene paths from manifest at `fname`"""
+    with open(fname) as f:
+        content = f.read()
+
+    if content.lstrip().startswith("["):
+        return list(json.loads(content))
+
+    return [
+        line.strip() for line in content.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
+def publish_scene(scene, plugins, targets=None):
+    """Open and publish `scene`, returning a result record
+
+    Arguments:
+        scene (str): Absolute path to Maya scene
+        plugins (list): Previously discovered plug-ins, re-used per scene
+        targets (list, optional): Targets passed on to pyblish
+
+    Returns:
+        dict: JSON-compatible record of the publish
+
+    """
+
+    from maya import cmds
+
+    record = {
+        "scene": scene,
+        "success": False,
+        "error": None,
+        "duration_s": None,
+        "results": list(),
+    }
+
+    start = time.time()
+
+    try:
+        cmds.file(scene, open=True, force=True, prompt=False)
+    except Exception as e:
+        record["error"] = "Could not open scene: %s" % e
+        record["duration_s"] = time.time() - start
+        return record
+
+    # Results are recorded as they are produced, rather than read from
+    # the context once published, as a result sink may trim them.
+    # See :func:`pyblish_maya.lib.register_result_sink`.
+    def on_processed(result):
+        error = result["error"]
+        instance = result["instance"]
+        record["results"].append({
+            "plugin": result["plugin"].__name__,
+            "instance": instance.name if instance is not None else None,
+            "success": result["success"],
+            "error": str(error) if error is not None else None,
+            "duration_ms": result["duration"],
+        })
+
+    pyblish.api.register_callback("pluginProcessed", on_processed)
+
+    try:
+        pyblish.util.publish(plugins=plugins, targets=targets)
+    finally:
+        pyblish.api.deregister_callback("pluginProcessed", on_processed)
+
+    record["success"] = all(r["success"] for r in record["results"])
+    record["duration_s"] = time.time() - start
+
+    # Opening the next scene with `force` discards this one,
+    # the undo queue is all that outlives it.
+    cmds.flushUndo()
+
+    return record
+
+
+def publish_scenes(scenes, targets=None):
+    """Publish each of `scenes` in turn, yielding a record per scene
+
+    Plug-ins are discovered once, up-front, and re-used for each scene.
+
+    """
+
+    plugins = pyblish.api.discover()
+
+    for scene in scenes:
+        yield publish_scene(os.path.abspath(scene), plugins, targets)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="pyblish_maya.batch",
+                                     description=__doc__.split("\n")[0])
+    parser.add_argument("scenes", nargs="*", help="Scenes to publish")
+    parser.add_argument("--manifest", help="File listing scenes to publish")
+    parser.add_argument("--output", help="Write records to this file, "
+                                         "defaults to standard out")
+    parser.add_argument("--targets", nargs="*", default=None,
+                        help="Targets to publish with")
+
+    opts = parser.parse_args(argv)
+
+    scenes = list(opts.scenes)
+    if opts.manifest:
+        scenes += read_manifest(opts.manifest)
+
+    if not scenes:
+        parser.error("No scenes given")
+
+    initialize()
+
+    output = open(opts.output, "w") if opts.output else sys.stdout
+
+    count = 0
+    failed = 0
+    start = time.time()
+
+    try:
+        for record in publish_scenes(scenes, opts.targets):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+
+            count += 1
+            failed += 0 if record["success"] else 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    duration = time.time() - start
+    sys.stderr.write(
+        "pyblish: Published %d scene(s), %d failed, in %.2fs "
+        "(%.1f scenes/minute)\n" % (
+            count, failed, duration,
+            count / duration * 60 if duration else 0
+        )
+    )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
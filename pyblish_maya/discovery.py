@@ -0,0 +1,305 @@
+"""Plug-in discovery, cached across publishes
+
+A drop-in replacement for :func:`pyblish.api.discover`. Modules are
+executed once per modification, keyed by path, size and modification
+time, and their plug-ins re-used by subsequent discoveries in the
+same session.
+
+As with :func:`pyblish.api.discover`, each discovery returns new
+plug-in classes, here subclassed from those of the cached module, such
+that changes made to them, such as by discovery filters or toggling
+`active` in a graphical user interface, do not carry over into the
+next discovery.
+
+An optional index on disk remembers the contents of each plug-in
+directory, along with files found to contain no plug-ins, such that a
+fresh session need not list unchanged directories, nor execute helper
+modules, on slow network shares.
+
+Example:
+    >>> import pyblish_maya
+    >>> pyblish_maya.setup(discovery="/tmp/pyblish_discovery.json")
+
+"""
+
+import os
+import sys
+import json
+import types
+import inspect
+import logging
+import warnings
+
+import pyblish.api
+import pyblish.plugin
+
+log = logging.getLogger("pyblish_maya.discovery")
+
+self = sys.modules[__name__]
+self._modules = dict()
+self._index = {"dirs": dict()}
+self._index_fname = None
+self._index_dirty = False
+self._original = None
+
+_index_version = 1
+
+
+def discover(type=None, regex=None, paths=None):
+    """Find and return available plug-ins, see :func:`pyblish.api.discover`
+
+    Plug-ins of files unmodified since a previous discovery
+    are re-used, rather than executed again, and returned as
+    fresh subclasses, see :func:`_fresh`.
+
+    """
+
+    if type is not None:
+        warnings.warn("type argument has been deprecated and does nothing")
+
+    if regex is not None:
+        warnings.warn("discover(): regex argument "
+                      "has been deprecated and does nothing")
+
+    plugins = dict()
+    plugin_names = list()
+    allow_duplicates = pyblish.plugin.ALLOW_DUPLICATES
+
+    for path in paths or pyblish.plugin.plugin_paths():
+        path = os.path.normpath(path)
+
+        for abspath in _files(path):
+            module = _module(abspath)
+
+            if module is None:
+                continue
+
+            for plugin in pyblish.plugin.plugins_from_module(module):
+                if not allow_duplicates and plugin.__name__ in plugin_names:
+                    log.debug("Duplicate plug-in found: %s", plugin)
+                    continue
+
+                plugin_names.append(plugin.__name__)
+
+                plugin = _fresh(plugin, module)
+                key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
+                plugins[key] = plugin
+
+    # Directly registered plug-ins take precedence
+    for plugin in pyblish.plugin.registered_plugins():
+        if not allow_duplicates and plugin.__name__ in plugin_names:
+            log.debug("Duplicate plug-in found: %s", plugin)
+            continue
+
+        plugin_names.append(plugin.__name__)
+        plugins[plugin.__name__] = plugin
+
+    plugins = list(plugins.values())
+    pyblish.plugin.sort(plugins)
+
+    for filter_ in pyblish.api.registered_discovery_filters():
+        filter_(plugins)
+
+    if self._index_dirty:
+        _save_index()
+
+    return plugins
+
+
+def _fresh(plugin, module):
+    """Return a subclass of `plugin`, independent of prior discoveries
+
+    Attributes assigned to the subclass shadow, rather than replace,
+    those of the cached class, which is left as its module defined it.
+
+    """
+
+    return type(plugin.__name__, (plugin,), {
+        "__module__": module.__file__,
+        "__doc__": plugin.__doc__,
+    })
+
+
+def _files(path):
+    """Return absolute path of each potential plug-in module in `path`"""
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        log.debug("Skipped: \"%s\", path is not a valid folder", path)
+        return []
+
+    entry = self._index["dirs"].get(path)
+
+    if entry is not None and entry["mtime"] == mtime:
+        return [os.path.join(path, fname) for fname in sorted(entry["files"])]
+
+    try:
+        fnames = os.listdir(path)
+    except OSError as err:
+        log.debug("Skipped: \"%s\" (%s)", path, err)
+        return []
+
+    files = dict()
+    for fname in sorted(fnames):
+        if fname.startswith("_") or not fname.endswith(".py"):
+            continue
+
+        if not os.path.isfile(os.path.join(path, fname)):
+            continue
+
+        # Whether file has plug-ins, unknown until executed
+        files[fname] = None
+
+    if entry is not None:
+        for fname in files:
+            files[fname] = entry["files"].get(fname)
+
+    self._index["dirs"][path] = {"mtime": mtime, "files": files}
+    self._index_dirty = True
+
+    return [os.path.join(path, fname) for fname in sorted(files)]
+
+
+def _module(abspath):
+    """Return module of `abspath`, executing it only when modified
+
+    Returns None for modules which fail to execute, or which are
+    known to contain no plug-ins. Only the latter are remembered.
+
+    """
+
+    try:
+        stat = os.stat(abspath)
+    except OSError:
+        return None
+
+    key = [stat.st_size, stat.st_mtime]
+
+    try:
+        previous_key, module = self._modules[abspath]
+    except KeyError:
+        pass
+    else:
+        if previous_key == key:
+            return module
+
+    dirname, fname = os.path.split(abspath)
+    files = self._index["dirs"].get(dirname, {}).get("files", {})
+    known = files.get(fname)
+
+    # Known, from a previous session, to contain no plug-ins
+    if known is not None and known[0] == key and not known[1]:
+        self._modules[abspath] = (key, None)
+        return None
+
+    module = types.ModuleType(os.path.splitext(fname)[0])
+    module.__file__ = abspath
+
+    try:
+        with open(abspath, "rb") as f:
+            code = compile(f.read(), abspath, "exec")
+        exec(code, module.__dict__)
+
+        # Store reference to original module, to avoid
+        # garbage collection from collecting it's global
+        # imports, such as `import os`.
+        sys.modules[abspath] = module
+
+    except Exception as err:
+        log.error("Skipped: \"%s\" (%s)", fname, err)
+        module = None
+
+    self._index_dirty = True
+
+    if module is None:
+        # Unknown, such as when failing on a missing import,
+        # and so tried again by subsequent discoveries.
+        files[fname] = None
+        self._modules.pop(abspath, None)
+        return None
+
+    files[fname] = [key, any(
+        inspect.isclass(obj) and issubclass(obj, pyblish.plugin.Plugin)
+        for obj in vars(module).values()
+    )]
+
+    self._modules[abspath] = (key, module)
+
+    return module
+
+
+def clear():
+    """Forget all discovered modules, and the index"""
+    self._modules.clear()
+    self._index = {"dirs": dict()}
+    self._index_dirty = True
+
+
+def install(index=None):
+    """Replace pyblish.api.discover with :func:`discover`
+
+    Arguments:
+        index (str, optional): Path to index on disk, read
+            now and written as discovery finds changes.
+
+    """
+
+    uninstall()
+
+    self._original = pyblish.plugin.discover
+    pyblish.plugin.discover = discover
+    pyblish.api.discover = discover
+
+    self._index_fname = index
+    if index:
+        _load_index()
+
+
+def uninstall():
+    """Restore pyblish.api.discover"""
+    if self._original is None:
+        return
+
+    pyblish.plugin.discover = self._original
+    pyblish.api.discover = self._original
+
+    self._original = None
+    self._index_fname = None
+
+
+def _load_index():
+    try:
+        with open(self._index_fname) as f:
+            index = json.load(f)
+    except (IOError, OSError, ValueError):
+        return
+
+    if index.get("version") != _index_version:
+        return
+
+    self._index = {"dirs": index["dirs"]}
+    self._index_dirty = False
+
+
+def _save_index():
+    self._index_dirty = False
+
+    if not self._index_fname:
+        return
+
+    index = {"version": _index_version, "dirs": self._index["dirs"]}
+
+    # Write, then rename, such that concurrent sessions
+    # never read half an index.
+    tmp = "%s.%d.tmp" % (self._index_fname, os.getpid())
+
+    try:
+        with open(tmp, "w") as f:
+            json.dump(index, f)
+
+        if os.path.exists(self._index_fname):
+            os.remove(self._index_fname)
+        os.rename(tmp, self._index_fname)
+
+    except (IOError, OSError) as err:
+        log.warning("Could not write discovery index: %s", err)
@@ -0,0 +1,264 @@
+"""Graphical parts of the integration
+
+This module depends on Qt and is only imported once a graphical
+user interface is requested, via :func:`pyblish_maya.show`,
+:func:`pyblish_maya.dock` or the File-menu item. Keeping it separate
+from :mod:`pyblish_maya.lib` means mayabatch and mayapy never pay for it.
+
+"""
+
+# Standard library
+import os
+import sys
+
+# Pyblish libraries
+import pyblish
+import pyblish.api
+
+# Host libraries
+from maya import cmds
+
+# Local libraries
+from .vendor.Qt import QtWidgets, QtGui
+
+self = sys.modules[__name__]
+self._dock = None
+self._dock_control = None
+self._window = None
+self._main_window = None
+
+_control_name = "pyblishMayaDock"
+
+
+def main_window():
+    """Return the main Maya window, or None if it could not be found
+
+    The window is looked up once, and cached for as long as it exists.
+
+    """
+
+    if self._main_window is not None:
+        try:
+            self._main_window.objectName()
+        except RuntimeError:
+            # Underlying C++ object deleted
+            self._main_window = None
+        else:
+            return self._main_window
+
+    for obj in QtWidgets.QApplication.instance().topLevelWidgets():
+        if obj.objectName() == "MayaWindow":
+            self._main_window = obj
+            return obj
+
+
+def show_no_gui():
+    """Popup with information about how to register a new GUI
+
+    In the event of no GUI being registered or available,
+    this information dialog will appear to guide the user
+    through how to get set up with one.
+
+    """
+
+    messagebox = QtWidgets.QMessageBox()
+    messagebox.setIcon(messagebox.Warning)
+    messagebox.setWindowIcon(QtGui.QIcon(os.path.join(
+        os.path.dirname(pyblish.__file__),
+        "icons",
+        "logo-32x32.svg"))
+    )
+
+    spacer = QtWidgets.QWidget()
+    spacer.setMinimumSize(400, 0)
+    spacer.setSizePolicy(QtWidgets.QSizePolicy.Minimum,
+                         QtWidgets.QSizePolicy.Expanding)
+
+    layout = messagebox.layout()
+    layout.addWidget(spacer, layout.rowCount(), 0, 1, layout.columnCount())
+
+    messagebox.setWindowTitle("Uh oh")
+
+    text = "No registered GUI found.\n\n"
+
+    if not pyblish.api.registered_guis():
+        text += (
+            "In order to show you a GUI, one must first be registered. "
+            "\n"
+            "Pyblish supports one or more graphical user interfaces "
+            "to be registered at once, the next acting as a fallback to "
+            "the previous."
+            "\n"
+            "\n"
+            "For example, to use Pyblish Lite, first install it:"
+            "\n"
+            "\n"
+            "$ pip install pyblish-lite"
+            "\n"
+            "\n"
+            "Then register it, like so:"
+            "\n"
+            "\n"
+            ">>> import pyblish.api\n"
+            ">>> pyblish.api.register_gui(\"pyblish_lite\")"
+            "\n"
+            "\n"
+            "The next time you try running this, Lite will appear."
+            "\n"
+            "See http://api.pyblish.com/register_gui.html for "
+            "more information."
+        )
+    else:
+        text += (
+            "None of the registered graphical user interfaces "
+            "could be found."
+            "\n"
+            "These interfaces are currently registered:"
+            "\n"
+            "%s" % "\n".join(pyblish.api.registered_guis())
+        )
+
+    messagebox.setText(text)
+    messagebox.setStandardButtons(messagebox.Ok)
+    messagebox.exec_()
+
+
+class Dock(QtWidgets.QWidget):
+
+    def __init__(self, parent=None):
+        super(Dock, self).__init__(parent)
+        QtWidgets.QVBoxLayout(self)
+        self.setObjectName("pyblish_maya.dock")
+
+
+def dock(window=None):
+    """Dock `window` to the right-hand side of the main Maya window
+
+    The dock is created once and re-used. Docking the window already
+    docked, or no window at all, shows the dock with its current window,
+    reset if it has a `reset` method. Docking another window replaces,
+    and deletes, the current one. Free both via :func:`release_dock`.
+
+    """
+
+    if window is None:
+        window = self._window
+
+    if not _alive(window):
+        raise ValueError("No window has been docked.")
+
+    if not _dock_exists():
+        _create_dock(window.windowTitle())
+
+    if window is not self._window:
+        if _alive(self._window):
+            self._dock.layout().removeWidget(self._window)
+            self._window.deleteLater()
+
+        self._dock.layout().addWidget(window)
+        self._window = window
+
+    elif hasattr(window, "reset"):
+        window.reset()
+
+    window.show()
+
+    if _workspace_control_supported():
+        cmds.workspaceControl(self._dock_control, edit=True,
+                              restore=True, label=window.windowTitle())
+    else:
+        cmds.dockControl(self._dock_control, edit=True,
+                         visible=True, label=window.windowTitle())
+
+
+def release_dock():
+    """Delete the dock and its window, freeing their memory"""
+    for widget in (self._window, self._dock):
+        if _alive(widget):
+            widget.setParent(None)
+            widget.deleteLater()
+
+    if self._dock_control and _control_exists(self._dock_control):
+        cmds.deleteUI(self._dock_control)
+
+    self._window = None
+    self._dock = None
+    self._dock_control = None
+
+
+def _workspace_control_supported():
+    # Maya 2017 and above
+    return hasattr(cmds, "workspaceControl")
+
+
+def _control_exists(control):
+    if _workspace_control_supported():
+        return cmds.workspaceControl(control, query=True, exists=True)
+    return cmds.dockControl(control, query=True, exists=True)
+
+
+def _alive(widget):
+    if widget is None:
+        return False
+
+    try:
+        widget.objectName()
+    except RuntimeError:
+        # Underlying C++ object deleted, e.g. alongside its control
+        return False
+
+    return True
+
+
+def _dock_exists():
+    if not _alive(self._dock) or not self._dock_control:
+        return False
+
+    return _control_exists(self._dock_control)
+
+
+def _create_dock(title):
+    # Keep the window, it is added to the new dock by the caller
+    if _alive(self._window):
+        self._window.setParent(None)
+    self._window = None
+
+    if _alive(self._dock):
+        self._dock.deleteLater()
+
+    if self._dock_control and _control_exists(self._dock_control):
+        cmds.deleteUI(self._dock_control)
+
+    if _workspace_control_supported():
+        from maya import OpenMayaUI
+        from .vendor.Qt import QtCompat
+
+        if cmds.workspaceControl(_control_name, query=True, exists=True):
+            cmds.deleteUI(_control_name)
+
+        control = cmds.workspaceControl(_control_name,
+                                        label=title,
+                                        retain=True,
+                                        dockToMainWindow=("right", False))
+
+        host = QtCompat.wrapInstance(
+            int(OpenMayaUI.MQtUtil.findControl(control)),
+            QtWidgets.QWidget
+        )
+
+        dock = Dock(parent=host)
+        host.layout().addWidget(dock)
+
+    else:
+        parent = main_window()
+
+        if not parent:
+            raise ValueError("Could not find the main Maya window.")
+
+        dock = Dock(parent=parent)
+        control = cmds.dockControl(label=title, area="right",
+                                   visible=True, content=dock.objectName(),
+                                   allowedArea=["right", "left"])
+
+    self._dock = dock
+    self._dock_control = control
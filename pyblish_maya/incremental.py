@@ -0,0 +1,350 @@
+"""Skip extraction of instances unchanged since their last publish
+
+Each instance is fingerprinted by the UUIDs of its members, their
+shapes and history, the values of their attributes, the geometry of
+meshes and the modification time of files they depend on.
+Outputs of an extraction are stored alongside its fingerprint, in a
+cache under the workspace, and restored rather than extracted again
+when the fingerprint matches. Entries are per instance and key, such
+that more than one extractor may cache outputs of the same instance.
+
+Example:
+    >>> class ExtractModel(pyblish.api.InstancePlugin):
+    ...     order = pyblish.api.ExtractorOrder
+    ...
+    ...     def process(self, instance):
+    ...         path = os.path.join(instance.data["stagingDir"], "model.ma")
+    ...         cache = incremental.cache(instance.context)
+    ...
+    ...         if cache.restore(instance, [path], key="model"):
+    ...             return self.log.info("Unchanged, skipped extraction")
+    ...
+    ...         export(instance, path)
+    ...         cache.store(instance, [path], key="model")
+
+Force a full rebuild with `context.data["rebuild"] = True`, or
+by setting the PYBLISH_MAYA_REBUILD environment variable to "1".
+
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+
+# Bytes stored in the cache, beyond which least recently used
+# entries are evicted. Overridden by PYBLISH_MAYA_CACHE_SIZE.
+DEFAULT_MAX_SIZE = 10 * 1024 ** 3
+
+
+def fingerprint(instance, attributes=None):
+    """Return fingerprint of `instance`, as a hexadecimal string
+
+    Members are fingerprinted along with their descendants, such as
+    shapes, and the history of each, such as the inputs of a mesh. Each
+    node contributes its UUID and keyable attributes, and each mesh the
+    position of every vertex and UV, such that tweaks are included.
+    Files are those of textures upstream of the members or of their
+    assigned shading engines, by modification time.
+
+    Arguments:
+        instance (Instance): Instance whose members are node names
+        attributes (list, optional): Attributes of each member to include,
+            defaults to `instance.data["fingerprintAttributes"]`, or the
+            keyable attributes of each member. Descendants and history
+            always contribute their keyable attributes.
+
+    """
+
+    from maya import cmds
+
+    members = sorted(instance)
+    nodes = sorted(set(member.split(".", 1)[0] for member in members))
+
+    if attributes is None:
+        attributes = instance.data.get("fingerprintAttributes")
+
+    descendants = list()
+    history = list()
+
+    if nodes:
+        descendants = cmds.listRelatives(nodes,
+                                         allDescendents=True,
+                                         fullPath=True) or []
+        history = cmds.listHistory(nodes + descendants) or []
+
+    own = set(cmds.ls(nodes, long=True)) if nodes else set()
+    every = sorted(set(cmds.ls(nodes + descendants + history, long=True)))
+
+    data = {
+        "members": members,
+        "uuids": cmds.ls(every, uuid=True) if every else [],
+        "attributes": dict(),
+        "geometry": dict(),
+        "files": dict(),
+    }
+
+    for node in every:
+        if node in own and attributes:
+            attrs = attributes
+        else:
+            attrs = cmds.listAttr(node, keyable=True) or []
+
+        for attr in attrs:
+            try:
+                value = cmds.getAttr("%s.%s" % (node, attr))
+            except (RuntimeError, ValueError):
+                # Attribute not on this node, or not gettable
+                continue
+            data["attributes"]["%s.%s" % (node, attr)] = value
+
+    for mesh in cmds.ls(every, type="mesh", long=True) if every else []:
+        data["geometry"][mesh] = _geometry(mesh)
+
+    # Textures, upstream of members or of their shading engines
+    engines = cmds.listConnections(every, type="shadingEngine") or []
+    upstream = history + (cmds.listHistory(engines) or [] if engines else [])
+
+    for node in cmds.ls(upstream, type="file") if upstream else []:
+        path = cmds.getAttr(node + ".fileTextureName")
+        data["files"][path] = _mtime(path)
+
+    for path in instance.data.get("fingerprintFiles", []):
+        data["files"][path] = _mtime(path)
+
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=repr).encode("utf-8")
+    ).hexdigest()
+
+
+def _geometry(mesh):
+    """Return checksum of points and UVs of `mesh`"""
+    from maya import cmds
+
+    digest = hashlib.sha1()
+
+    for query in (
+        lambda: cmds.polyEvaluate(mesh, vertex=True),
+        lambda: cmds.polyEvaluate(mesh, face=True),
+        lambda: cmds.xform(mesh + ".vtx[*]", query=True,
+                           objectSpace=True, translation=True),
+        lambda: cmds.polyEditUV(mesh + ".map[*]", query=True),
+    ):
+        try:
+            value = query()
+        except (RuntimeError, ValueError):
+            # Such as a mesh without vertices, or UVs
+            value = None
+
+        digest.update(repr(value).encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _names(outputs):
+    """Return file name of each of `outputs`, which must be unique"""
+    names = [os.path.basename(path) for path in outputs]
+
+    if len(set(names)) != len(names):
+        raise ValueError("Outputs must have unique file names: %s"
+                         % ", ".join(outputs))
+
+    return names
+
+
+class Cache(object):
+    """Fingerprints and outputs of previous extractions
+
+    Arguments:
+        root (str): Directory of cache
+        max_size (int, optional): Bytes stored, beyond which least
+            recently used entries are evicted.
+        rebuild (bool, optional): Never restore, only store
+
+    """
+
+    def __init__(self, root, max_size=DEFAULT_MAX_SIZE, rebuild=False):
+        self.root = root
+        self.max_size = max_size
+        self.rebuild = rebuild
+
+    def restore(self, instance, outputs, key=None):
+        """Copy previous `outputs` of `instance` into place, if unchanged
+
+        Arguments:
+            instance (Instance): Instance extracted
+            outputs (list): Absolute paths of files extracted, each
+                of a unique file name.
+            key (str, optional): Entry of `instance` to restore, for
+                when more than one plug-in extracts an instance. Defaults
+                to the file names of `outputs`.
+
+        Returns:
+            bool: Whether outputs were restored, and extraction may be skipped
+
+        """
+
+        names = _names(outputs)
+
+        if self.rebuild:
+            return False
+
+        entry = self._read(instance, key, names)
+        if entry is None:
+            return False
+
+        if entry["fingerprint"] != self._fingerprint(instance):
+            return False
+
+        if sorted(entry["outputs"]) != sorted(names):
+            return False
+
+        directory = self._directory(instance, key, names)
+        cached = [os.path.join(directory, name) for name in names]
+
+        # Removed since stored, such as by another session
+        if not all(os.path.isfile(path) for path in cached):
+            return False
+
+        try:
+            for src, dst in zip(cached, outputs):
+                shutil.copy2(src, dst)
+        except (IOError, OSError):
+            return False
+
+        # Mark as recently used
+        os.utime(self._entry(instance, key, names), None)
+
+        return True
+
+    def store(self, instance, outputs, key=None):
+        """Store `outputs` of `instance`, along with its fingerprint
+
+        Arguments are those of :meth:`restore`.
+
+        """
+
+        names = _names(outputs)
+        directory = self._directory(instance, key, names)
+
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.makedirs(directory)
+
+        size = 0
+        for path in outputs:
+            shutil.copy2(path, directory)
+            size += os.path.getsize(path)
+
+        entry = {
+            "instance": instance.data.get("name", str(instance)),
+            "key": key,
+            "fingerprint": self._fingerprint(instance),
+            "outputs": names,
+            "size": size,
+            "time": time.time(),
+        }
+
+        with open(self._entry(instance, key, names), "w") as f:
+            json.dump(entry, f)
+
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries, until below max size"""
+        entries = list()
+
+        for fname in os.listdir(self.root):
+            if not fname.endswith(".json"):
+                continue
+
+            path = os.path.join(self.root, fname)
+
+            try:
+                with open(path) as f:
+                    size = json.load(f)["size"]
+            except (IOError, OSError, ValueError, KeyError):
+                size = 0
+
+            entries.append((os.path.getmtime(path), size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove all entries"""
+        if os.path.isdir(self.root):
+            shutil.rmtree(self.root)
+        os.makedirs(self.root)
+
+    def _fingerprint(self, instance):
+        # Computed once per instance and publish
+        if "fingerprint" not in instance.data:
+            instance.data["fingerprint"] = fingerprint(instance)
+        return instance.data["fingerprint"]
+
+    def _key(self, instance, key, names):
+        name = instance.data.get("name", str(instance))
+        key = key if key is not None else "|".join(sorted(names))
+        return hashlib.sha1(
+            ("%s/%s" % (name, key)).encode("utf-8")
+        ).hexdigest()
+
+    def _entry(self, instance, key, names):
+        return os.path.join(self.root,
+                            self._key(instance, key, names) + ".json")
+
+    def _directory(self, instance, key, names):
+        return os.path.join(self.root, self._key(instance, key, names))
+
+    def _read(self, instance, key, names):
+        try:
+            with open(self._entry(instance, key, names)) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _remove(self, entry):
+        directory = os.path.splitext(entry)[0]
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.remove(entry)
+
+
+def cache(context):
+    """Return cache of `context`, under its workspace directory
+
+    The cache is stored in the `.pyblish/cache` subdirectory of
+    `context.data["workspaceDir"]`, as collected by CollectMayaWorkspace.
+
+    """
+
+    if "incrementalCache" not in context.data:
+        root = os.path.join(context.data["workspaceDir"], ".pyblish", "cache")
+
+        if not os.path.isdir(root):
+            os.makedirs(root)
+
+        context.data["incrementalCache"] = Cache(
+            root,
+            max_size=int(os.environ.get("PYBLISH_MAYA_CACHE_SIZE",
+                                        DEFAULT_MAX_SIZE)),
+            rebuild=(context.data.get("rebuild") or
+                     os.environ.get("PYBLISH_MAYA_REBUILD") == "1"),
+        )
+
+    return context.data["incrementalCache"]
@@ -1,55 +1,216 @@
 # Standard library
 import os
 import sys
+import time
+import types
 import inspect
+import tempfile
 import contextlib
 
 # Pyblish libraries
 import pyblish
 import pyblish.api
-
-# Host libraries
-from maya import mel, cmds
+import pyblish.lib
 
 # Local libraries
 from . import plugins
-from .vendor.Qt import QtWidgets, QtGui
+
+# Host and Qt libraries are imported on first use, such that
+# mayabatch and mayapy only ever pay for what they need.
+# See :mod:`pyblish_maya.gui` for the graphical parts.
 
 self = sys.modules[__name__]
 self._has_been_setup = False
 self._has_menu = False
 self._registered_gui = None
-self._dock = None
-self._dock_control = None
-
-
-def setup(menu=True):
+self._gui = None
+self._timings = dict()
+self._callbacks = list()
+self._scene_state = dict()
+self._plugin_wrappers = list()
+self._performance_wrapper = None
+self._performance_context = None
+self._profiler = None
+self._profile_fname = None
+self._cmds_accounting = None
+self._discovered_gui = None
+self._result_sink = None
+self._file_hashes = dict()
+self._revalidation = None
+
+# Sentinel of names absent, as opposed to None
+_missing = object()
+
+try:
+    _clock = time.perf_counter
+except AttributeError:
+    # Python 2
+    _clock = time.time
+
+
+def setup(menu=True,
+          performance=None,
+          profile=None,
+          prewarm=None,
+          results=None,
+          discovery=None,
+          revalidate=None,
+          trim=None):
     """Setup integration
 
     Registers Pyblish for Maya plug-ins and appends an item to the File-menu
 
+    Qt and graphical user interfaces are not imported here, but
+    on first call to :func:`show` or :func:`dock`.
+
     Attributes:
         console (bool): Display console with GUI
         port (int, optional): Port from which to start looking for an
             available port to connect with Pyblish QML, default
             provided by Pyblish Integration.
+        performance (bool or str, optional): Process each plug-in within
+            :func:`publish_performance`. Pass the name of an evaluation
+            mode, such as "off", to also switch evaluation mode. Defaults
+            to the PYBLISH_MAYA_PERFORMANCE environment variable, where
+            "1" means True.
+        profile (bool or str, optional): Profile each plug-in processed,
+            see :func:`register_profiler`. A Chrome trace is written after
+            each publish to this path or, if True, to
+            pyblish_maya_profile.json in the temporary directory, and a
+            summary printed. Defaults to the
+            PYBLISH_MAYA_PROFILE environment variable, where "1" means True.
+        prewarm (bool, optional): Import Qt and the registered GUI once
+            Maya is idle, such that the first call to :func:`show` is
+            instant. Defaults to the PYBLISH_MAYA_PREWARM environment
+            variable, where "1" means True.
+        results (str, optional): Stream each result to this path,
+            see :func:`register_result_sink`. Defaults to the
+            PYBLISH_MAYA_RESULTS environment variable.
+        discovery (bool or str, optional): Cache discovered plug-ins
+            across publishes, see :mod:`pyblish_maya.discovery`. Pass a
+            path to also keep an index on disk, for use by subsequent
+            sessions. Defaults to the PYBLISH_MAYA_DISCOVERY environment
+            variable, where "1" means True.
+        revalidate (bool, optional): Re-use results of validators whose
+            instances are unchanged since last validated, see
+            :func:`register_revalidation`. Defaults to the
+            PYBLISH_MAYA_REVALIDATE environment variable, where "1"
+            means True.
+        trim (bool, optional): Remove each result from the context once
+            streamed to `results`, such that results do not accumulate
+            in memory; for headless publishing, as graphical user
+            interfaces rely on them. Defaults to the
+            PYBLISH_MAYA_RESULTS_TRIM environment variable, where "1"
+            means True.
 
     """
 
     if self._has_been_setup:
         teardown()
 
-    register_plugins()
-    register_host()
+    with _timed("register_plugins"):
+        register_plugins()
+
+    with _timed("register_host"):
+        register_host()
+
+    with _timed("register_callbacks"):
+        register_callbacks()
+
+    if performance is None:
+        performance = os.environ.get("PYBLISH_MAYA_PERFORMANCE")
+        performance = True if performance == "1" else performance
+
+    if performance:
+        register_performance(
+            evaluation=performance if performance is not True else None
+        )
+
+    if profile is None:
+        profile = os.environ.get("PYBLISH_MAYA_PROFILE")
+        profile = True if profile == "1" else profile
+
+    if profile is True:
+        profile = os.path.join(tempfile.gettempdir(),
+                               "pyblish_maya_profile.json")
+
+    if profile:
+        register_profiler(fname=profile)
 
     if menu:
-        add_to_filemenu()
+        with _timed("menu"):
+            add_to_filemenu()
         self._has_menu = True
 
+    if discovery is None:
+        discovery = os.environ.get("PYBLISH_MAYA_DISCOVERY")
+        discovery = True if discovery == "1" else discovery
+
+    if discovery:
+        from . import discovery as discovery_
+        discovery_.install(index=discovery if discovery is not True else None)
+
+    if revalidate is None:
+        revalidate = os.environ.get("PYBLISH_MAYA_REVALIDATE") == "1"
+
+    if revalidate:
+        register_revalidation()
+
+    if results is None:
+        results = os.environ.get("PYBLISH_MAYA_RESULTS")
+
+    if trim is None:
+        trim = os.environ.get("PYBLISH_MAYA_RESULTS_TRIM") == "1"
+
+    if results:
+        register_result_sink(results, trim=trim)
+
+    if prewarm is None:
+        prewarm = os.environ.get("PYBLISH_MAYA_PREWARM") == "1"
+
+    if prewarm:
+        schedule_prewarm()
+
     self._has_been_setup = True
     print("Pyblish loaded successfully.")
 
 
+def timings():
+    """Return time spent, in seconds, per phase of startup
+
+    Phases are recorded as they happen, and include "import",
+    "register_plugins", "register_host", "register_callbacks",
+    "menu" and, once a GUI has been requested, "import_gui".
+
+    Example:
+        >>> setup(menu=False)
+        >>> sorted(timings())
+        ['import', 'register_callbacks', 'register_host', 'register_plugins']
+
+    """
+
+    return dict(self._timings)
+
+
+@contextlib.contextmanager
+def _timed(phase):
+    """Record time spent within context as `phase`"""
+    start = time.time()
+    try:
+        yield
+    finally:
+        self._timings[phase] = time.time() - start
+
+
+def _import_gui():
+    """Import the Qt-dependent parts of the integration on first use"""
+    if self._gui is None:
+        with _timed("import_gui"):
+            from . import gui
+        self._gui = gui
+    return self._gui
+
+
 def show():
     """Try showing the most desirable GUI
 
@@ -59,24 +220,49 @@ def show():
 
     """
 
-    parent = next(
-        o for o in QtWidgets.QApplication.instance().topLevelWidgets()
-        if o.objectName() == "MayaWindow"
-    )
+    gui = _import_gui()
+    parent = gui.main_window()
 
-    gui = _discover_gui()
+    show_ = _discover_gui()
 
-    if gui is None:
-        _show_no_gui()
+    if show_ is None:
+        gui.show_no_gui()
     else:
-        return gui(parent)
+        return show_(parent)
+
+
+def dock(window=None):
+    """Dock `window` to the right-hand side of the main Maya window
+
+    The dock and its window are kept between calls, such that calling
+    again without a window shows it again instantly. Free them with
+    :func:`release_dock`.
+
+    """
+
+    _import_gui().dock(window)
+
+
+def release_dock():
+    """Delete the dock and its window, see :func:`dock`"""
+    if self._gui is not None:
+        self._gui.release_dock()
 
 
 def _discover_gui():
-    """Return the most desirable of the currently registered GUIs"""
+    """Return the most desirable of the currently registered GUIs
+
+    The result is cached until the registered GUIs change.
+
+    """
+
+    registered = tuple(pyblish.api.registered_guis())
+
+    if self._discovered_gui and self._discovered_gui[0] == registered:
+        return self._discovered_gui[1]
 
     # Prefer last registered
-    guis = reversed(pyblish.api.registered_guis())
+    guis = reversed(registered)
 
     for gui in guis:
         try:
@@ -84,9 +270,29 @@ def _discover_gui():
         except (ImportError, AttributeError):
             continue
         else:
+            self._discovered_gui = (registered, gui)
             return gui
 
 
+def schedule_prewarm():
+    """Import Qt and the most desirable GUI once Maya is idle
+
+    Does nothing in batch mode.
+
+    """
+
+    from maya import cmds
+
+    if hasattr(cmds, "about") and not cmds.about(batch=True):
+        cmds.evalDeferred(_prewarm, lowestPriority=True)
+
+
+def _prewarm():
+    with _timed("prewarm"):
+        _import_gui().main_window()
+        _discover_gui()
+
+
 def teardown():
     """Remove integration"""
     if not self._has_been_setup:
@@ -94,6 +300,15 @@ def teardown():
 
     deregister_plugins()
     deregister_host()
+    deregister_callbacks()
+    deregister_performance()
+    deregister_profiler()
+    deregister_cmds_accounting()
+    deregister_result_sink()
+    deregister_revalidation()
+
+    if "pyblish_maya.discovery" in sys.modules:
+        sys.modules["pyblish_maya.discovery"].uninstall()
 
     if self._has_menu:
         remove_from_filemenu()
@@ -107,6 +322,10 @@ def deregister_plugins():
     # Register accompanying plugins
     plugin_path = os.path.dirname(plugins.__file__)
     pyblish.api.deregister_plugin_path(plugin_path)
+
+    if _wrap_plugins in pyblish.api.registered_discovery_filters():
+        pyblish.api.deregister_discovery_filter(_wrap_plugins)
+
     print("pyblish: Deregistered %s" % plugin_path)
 
 
@@ -124,13 +343,827 @@ def deregister_host():
     pyblish.api.deregister_host("maya")
 
 
+def register_callbacks():
+    """Register callbacks with Maya, such as those keeping caches fresh"""
+    om = _openmaya()
+
+    for message in ("kAfterOpen", "kAfterNew", "kAfterSave"):
+        self._callbacks.append(om.MSceneMessage.addCallback(
+            getattr(om.MSceneMessage, message),
+            invalidate_scene_state
+        ))
+
+    for event in ("workspaceChanged",
+                  "playbackRangeChanged",
+                  "timeUnitChanged",
+                  "linearUnitChanged",
+                  "angularUnitChanged"):
+        self._callbacks.append(om.MEventMessage.addEventCallback(
+            event, invalidate_scene_state
+        ))
+
+
+def deregister_callbacks():
+    """Remove callbacks added by :func:`register_callbacks`"""
+    if self._callbacks:
+        om = _openmaya()
+
+        for callback in self._callbacks:
+            om.MMessage.removeCallback(callback)
+
+    self._callbacks[:] = []
+    invalidate_scene_state()
+
+
+def _openmaya():
+    try:
+        import maya.api.OpenMaya as om
+    except ImportError:
+        # Maya 2012 and below
+        import maya.OpenMaya as om
+    return om
+
+
+def register_profiler(fname=None):
+    """Profile each plug-in processed, see :mod:`pyblish_maya.profiler`
+
+    Arguments:
+        fname (str, optional): Write a Chrome trace of the profile
+            to this path, and print a summary, once published. The
+            profile is then cleared, ready for the next publish.
+
+    Returns:
+        Profiler: The active profiler, also available via :func:`profiler`
+
+    """
+
+    from . import profiler as profiler_
+
+    deregister_profiler()
+
+    self._profiler = profiler_.Profiler()
+    self._profile_fname = fname
+    register_plugin_wrapper(self._profiler.wrapper)
+
+    if fname:
+        pyblish.api.register_callback("published", _on_published_profile)
+
+    return self._profiler
+
+
+def deregister_profiler():
+    if self._profiler is None:
+        return
+
+    deregister_plugin_wrapper(self._profiler.wrapper)
+
+    if self._profile_fname:
+        pyblish.api.deregister_callback("published", _on_published_profile)
+
+    self._profiler = None
+    self._profile_fname = None
+
+
+def profiler():
+    """Return the active profiler, or None if not profiling"""
+    return self._profiler
+
+
+def _on_published_profile(context):
+    self._profiler.write(self._profile_fname)
+    print(self._profiler.format_summary())
+    print("pyblish: Wrote profile to %s" % self._profile_fname)
+
+    # Each publish is written on its own
+    self._profiler.clear()
+
+
+class CmdsAccounting(object):
+    """Count and time calls to maya.cmds made by plug-ins
+
+    While a plug-in processes, maya.cmds is replaced by a proxy recording
+    each call, both for those importing cmds during process and for
+    plug-in modules importing it at the top. Calls are attributed to the
+    plug-in making them.
+
+    Identical queries, being calls made in query mode or to commands
+    in `read_only`, are collected in `queries`, and those made more
+    than once are candidates for caching.
+
+    Arguments:
+        cmds (module, optional): Module to account for, defaults
+            to maya.cmds. Anything with callable members will do.
+
+    Example:
+        >>> accounting = register_cmds_accounting()
+        >>> # Publish..
+        >>> print(accounting.format_report(top=10))
+
+    """
+
+    # Commands that only ever query the scene
+    read_only = frozenset([
+        "attributeQuery",
+        "getAttr",
+        "listAttr",
+        "listConnections",
+        "listHistory",
+        "listRelatives",
+        "ls",
+        "nodeType",
+        "objExists",
+        "objectType",
+    ])
+
+    def __init__(self, cmds=None):
+        if cmds is None:
+            from maya import cmds
+
+        else:
+            # Prefer the package of Maya, where available, to a stand-in
+            try:
+                import maya  # noqa
+            except ImportError:
+                pass
+
+        self.cmds = cmds
+        self.proxy = _CmdsProxy(self)
+
+        # Each a mapping of key -> [count, seconds]
+        self.commands = dict()
+        self.flags = dict()
+        self.plugins = dict()
+        self.queries = dict()
+
+        self._plugin = None
+
+    def clear(self):
+        for stats in (self.commands, self.flags, self.plugins, self.queries):
+            stats.clear()
+
+    @contextlib.contextmanager
+    def wrapper(self, plugin, subject):
+        maya = sys.modules.get("maya")
+        module = sys.modules.get(type(plugin).__module__)
+
+        # Without Maya, such as with a stand-in cmds under test,
+        # a package is provided such that `from maya import cmds`
+        # finds the proxy.
+        standin = maya is None
+        if standin:
+            maya = sys.modules["maya"] = types.ModuleType("maya")
+
+        previous = (
+            self._plugin,
+            sys.modules.get("maya.cmds", _missing),
+            getattr(maya, "cmds", _missing),
+        )
+
+        self._plugin = getattr(plugin, "label", None) or type(plugin).__name__
+        sys.modules["maya.cmds"] = self.proxy
+        maya.cmds = self.proxy
+
+        swapped = getattr(module, "cmds", None) is self.cmds
+        if swapped:
+            module.cmds = self.proxy
+
+        try:
+            yield
+        finally:
+            self._plugin, cmds_module, cmds = previous
+
+            # Names not present before are removed, rather
+            # than replaced, so as to not halt later imports.
+            if cmds_module is _missing:
+                sys.modules.pop("maya.cmds", None)
+            else:
+                sys.modules["maya.cmds"] = cmds_module
+
+            if standin:
+                sys.modules.pop("maya", None)
+            elif cmds is _missing:
+                del maya.cmds
+            else:
+                maya.cmds = cmds
+
+            if swapped:
+                module.cmds = self.cmds
+
+    def call(self, name, func, args, kwargs):
+        start = _clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = _clock() - start
+
+            self._add(self.commands, name, duration)
+            self._add(self.flags, (name, tuple(sorted(kwargs))), duration)
+            self._add(self.plugins, (self._plugin, name), duration)
+
+            if (name in self.read_only or
+                    kwargs.get("query") or kwargs.get("q")):
+                key = (name, repr(args), repr(sorted(kwargs.items())))
+                self._add(self.queries, key, duration)
+
+    def _add(self, stats, key, duration):
+        try:
+            total = stats[key]
+        except KeyError:
+            total = stats[key] = [0, 0.0]
+
+        total[0] += 1
+        total[1] += duration
+
+    def repeated_queries(self, top=10):
+        """Return identical queries made more than once, most repeated first
+
+        Returns:
+            list: Tuples of (command, args, kwargs, count, seconds)
+
+        """
+
+        repeated = [
+            key + tuple(total)
+            for key, total in self.queries.items()
+            if total[0] > 1
+        ]
+
+        return sorted(repeated, key=lambda item: item[3], reverse=True)[:top]
+
+    def format_report(self, top=10):
+        """Return the most expensive calls as a human-readable table"""
+
+        def by_time(stats):
+            return sorted(stats.items(),
+                          key=lambda item: item[1][1],
+                          reverse=True)[:top]
+
+        lines = ["%-50s %8s %10s" % ("Command", "Calls", "Time (ms)")]
+        for name, (count, duration) in by_time(self.commands):
+            lines.append("%-50s %8d %10.1f" % (name, count, duration * 1e3))
+
+        lines += ["", "%-50s %8s %10s" % ("Flags", "Calls", "Time (ms)")]
+        for (name, flags), (count, duration) in by_time(self.flags):
+            name = "%s(%s)" % (name, ", ".join(flags))
+            lines.append("%-50s %8d %10.1f" % (
+                name[:50], count, duration * 1e3))
+
+        lines += ["", "%-50s %8s %10s" % ("Plug-in", "Calls", "Time (ms)")]
+        for (plugin, name), (count, duration) in by_time(self.plugins):
+            name = "%s: %s" % (plugin, name)
+            lines.append("%-50s %8d %10.1f" % (
+                name[:50], count, duration * 1e3))
+
+        lines += ["", "%-50s %8s %10s" % ("Repeated query", "Calls",
+                                          "Time (ms)")]
+        for name, args, kwargs, count, duration in self.repeated_queries(top):
+            name = "%s(%s, %s)" % (name, args, kwargs)
+            lines.append("%-50s %8d %10.1f" % (
+                name[:50], count, duration * 1e3))
+
+        return "\n".join(lines)
+
+
+class _CmdsProxy(object):
+    """Stand-in for maya.cmds, passing calls on via CmdsAccounting"""
+
+    def __init__(self, accounting):
+        self._accounting = accounting
+
+    def __getattr__(self, name):
+        attr = getattr(self._accounting.cmds, name)
+
+        if callable(attr):
+            attr = self._wrap(name, attr)
+
+        # Subsequent access bypasses __getattr__
+        setattr(self, name, attr)
+        return attr
+
+    def _wrap(self, name, func):
+        accounting = self._accounting
+
+        def call(*args, **kwargs):
+            return accounting.call(name, func, args, kwargs)
+
+        call.__name__ = name
+        call.__doc__ = func.__doc__
+        return call
+
+
+def register_cmds_accounting(cmds=None):
+    """Account for calls to maya.cmds made by plug-ins
+
+    Nothing is accounted for, nor replaced, until this is called.
+
+    Arguments:
+        cmds (module, optional): Passed on to :class:`CmdsAccounting`
+
+    Returns:
+        CmdsAccounting: The active accounting, also
+            available via :func:`cmds_accounting`
+
+    """
+
+    deregister_cmds_accounting()
+
+    self._cmds_accounting = CmdsAccounting(cmds)
+    register_plugin_wrapper(self._cmds_accounting.wrapper)
+
+    return self._cmds_accounting
+
+
+def deregister_cmds_accounting():
+    if self._cmds_accounting is not None:
+        deregister_plugin_wrapper(self._cmds_accounting.wrapper)
+        self._cmds_accounting = None
+
+
+def cmds_accounting():
+    """Return the active accounting, or None"""
+    return self._cmds_accounting
+
+
+def register_result_sink(fname, **kwargs):
+    """Stream each result to `fname`, see :mod:`pyblish_maya.sink`
+
+    Arguments:
+        fname (str): Path to JSONL file
+        **kwargs: Passed on to :class:`pyblish_maya.sink.ResultSink`,
+            such as `compress`, `max_bytes` and `trim`.
+
+    Returns:
+        ResultSink: The active sink, also available via :func:`result_sink`
+
+    """
+
+    from . import sink
+
+    deregister_result_sink()
+
+    self._result_sink = sink.ResultSink(fname, **kwargs)
+    pyblish.api.register_callback("pluginProcessed",
+                                  self._result_sink.on_processed)
+
+    return self._result_sink
+
+
+def deregister_result_sink():
+    if self._result_sink is None:
+        return
+
+    pyblish.api.deregister_callback("pluginProcessed",
+                                    self._result_sink.on_processed)
+    self._result_sink.close()
+    self._result_sink = None
+
+
+def result_sink():
+    """Return the active result sink, or None"""
+    return self._result_sink
+
+
+class Revalidation(object):
+    """Re-use results of validators whose instances are unchanged
+
+    Once validated, members of each instance are watched for changes via
+    node-dirty and attribute-changed callbacks, along with changes to the
+    DAG. Each member is watched along with its descendants, such as its
+    shapes, and their history, as read by validators. Validating again
+    processes only those validators whose instance has had a member
+    change, and re-uses the previous result, including any error, of
+    the rest.
+
+    A member stops being watched once changed, such that scrubbing an
+    animated scene costs nothing more than a single callback per node,
+    and is watched again once validated again.
+
+    An instance is the same across publishes when its name, members
+    and data are equal. Only instance plug-ins of validation order are
+    re-used; context plug-ins may depend on anything and always process.
+
+    Example:
+        >>> revalidation = register_revalidation()
+        >>> context = pyblish.util.validate()
+        >>> # Fix one thing..
+        >>> context = pyblish.util.validate()
+        >>> revalidation.skipped
+        41
+
+    """
+
+    def __init__(self):
+        # (plug-in, instance) -> (signature, generation, error)
+        self.results = dict()
+        self.skipped = 0
+
+        # Member -> generation of its last change
+        self._changed = dict()
+        self._generation = 0
+
+        # Node -> callbacks watching it, and members it affects
+        self._watched = dict()
+        self._owners = dict()
+
+        # Member -> nodes watched on its behalf
+        self._members = dict()
+
+        # Members changed, whose callbacks are yet to be removed
+        self._pending = set()
+
+        self._callbacks = list()
+
+    def install(self):
+        om = _openmaya()
+
+        self._callbacks.append(
+            om.MDagMessage.addAllDagChangesCallback(self._on_dag_changed)
+        )
+
+        for message in ("kAfterOpen", "kAfterNew"):
+            self._callbacks.append(om.MSceneMessage.addCallback(
+                getattr(om.MSceneMessage, message), self.clear
+            ))
+
+    def uninstall(self):
+        self.clear()
+
+        if self._callbacks:
+            om = _openmaya()
+
+            for callback in self._callbacks:
+                om.MMessage.removeCallback(callback)
+
+        self._callbacks[:] = []
+
+    def clear(self, *args):
+        """Forget all results, and stop watching their members"""
+        for member in list(self._members):
+            self._unwatch(member)
+
+        self._pending.clear()
+        self._changed.clear()
+        self.results.clear()
+
+    def process(self, plugin, subject, process):
+        """Call `process`, unless `subject` is unchanged since last time"""
+        if not self._applies(plugin, subject):
+            return process()
+
+        self._flush()
+
+        key = (self._plugin_key(plugin), subject.data.get("name"))
+        members = [str(member) for member in subject]
+        signature = repr((sorted(members), sorted(subject.data.items())))
+
+        try:
+            previous, generation, error = self.results[key]
+        except KeyError:
+            pass
+        else:
+            if previous == signature and not self._touched(members,
+                                                           generation):
+                self.skipped += 1
+                plugin.log.info("Unchanged since last validated, "
+                                "re-using result")
+
+                if error is not None:
+                    raise error
+                return
+
+        try:
+            result = process()
+        except Exception as error:
+            self._store(key, signature, members, error)
+            raise
+
+        self._store(key, signature, members, None)
+        return result
+
+    def _applies(self, plugin, subject):
+        return (
+            isinstance(plugin, pyblish.api.InstancePlugin) and
+            isinstance(subject, pyblish.api.Instance) and
+            pyblish.lib.inrange(plugin.order, pyblish.api.ValidatorOrder)
+        )
+
+    def _plugin_key(self, plugin):
+        Plugin = type(plugin)
+
+        # Discovered plug-ins carry the path of their module,
+        # edits to which invalidate their results.
+        try:
+            mtime = os.path.getmtime(Plugin.__module__)
+        except (OSError, TypeError):
+            mtime = None
+
+        return (Plugin.__module__, Plugin.__name__, mtime)
+
+    def _touched(self, members, generation):
+        changed = self._changed
+        return any(changed.get(member, -1) > generation for member in members)
+
+    def _store(self, key, signature, members, error):
+        # Results of members that cannot be watched are never re-used
+        if self._watch(members):
+            self.results[key] = (signature, self._generation, error)
+        else:
+            self.results.pop(key, None)
+
+    def _watch(self, members):
+        """Watch `members` for changes, returning whether all could be"""
+        from maya import cmds
+
+        om = _openmaya()
+
+        for member in members:
+            if member in self._members:
+                continue
+
+            # Components are watched via their node
+            node = member.split(".", 1)[0]
+
+            try:
+                nodes = [node]
+                nodes += cmds.listRelatives(node,
+                                            allDescendents=True,
+                                            fullPath=True) or []
+                nodes += cmds.listHistory(nodes) or []
+            except (RuntimeError, ValueError):
+                # No longer exists
+                return False
+
+            watched = list()
+            self._members[member] = watched
+
+            for node in set(nodes):
+                if node not in self._watched:
+                    try:
+                        obj = om.MSelectionList().add(node).getDependNode(0)
+                    except RuntimeError:
+                        self._unwatch(member)
+                        return False
+
+                    self._watched[node] = [
+                        om.MNodeMessage.addNodeDirtyCallback(
+                            obj, self._on_changed, node),
+                        om.MNodeMessage.addAttributeChangedCallback(
+                            obj, self._on_changed, node),
+                    ]
+                    self._owners[node] = set()
+
+                self._owners[node].add(member)
+                watched.append(node)
+
+        return True
+
+    def _unwatch(self, member):
+        """Stop watching nodes of `member`, unless watched for another"""
+        om = None
+
+        for node in self._members.pop(member, []):
+            owners = self._owners[node]
+            owners.discard(member)
+
+            if owners:
+                continue
+
+            del self._owners[node]
+            om = om or _openmaya()
+
+            for callback in self._watched.pop(node):
+                try:
+                    om.MMessage.removeCallback(callback)
+                except RuntimeError:
+                    # Node deleted along with its callbacks
+                    pass
+
+    def _flush(self):
+        """Stop watching members changed since last validated"""
+        pending, self._pending = self._pending, set()
+
+        for member in pending:
+            self._unwatch(member)
+
+    def _changes(self, names):
+        self._generation += 1
+
+        for name in names:
+            self._changed[name] = self._generation
+
+            for member in self._owners.get(name, ()):
+                self._changed[member] = self._generation
+
+                if not self._pending:
+                    # Callbacks may not be removed from within
+                    # a callback, so are removed once idle.
+                    _defer_idle(self._flush)
+
+                self._pending.add(member)
+
+    def _on_changed(self, *args):
+        # Node is passed as client data, last
+        self._changes(args[-1:])
+
+    def _on_dag_changed(self, message, child, parent, *args):
+        names = list()
+
+        for path in (child, parent):
+            try:
+                names += [path.fullPathName(), path.partialPathName()]
+            except (AttributeError, RuntimeError):
+                # The world, or an invalid path
+                continue
+
+        self._changes(names)
+
+
+def register_revalidation():
+    """Re-use results of validators whose instances are unchanged
+
+    See :class:`Revalidation`.
+
+    Returns:
+        Revalidation: The active revalidation, also
+            available via :func:`revalidation`
+
+    """
+
+    deregister_revalidation()
+
+    self._revalidation = Revalidation()
+    self._revalidation.install()
+
+    return self._revalidation
+
+
+def deregister_revalidation():
+    if self._revalidation is not None:
+        self._revalidation.uninstall()
+        self._revalidation = None
+
+
+def revalidation():
+    """Return the active revalidation, or None"""
+    return self._revalidation
+
+
 def register_plugins():
     # Register accompanying plugins
     plugin_path = os.path.dirname(plugins.__file__)
     pyblish.api.register_plugin_path(plugin_path)
+
+    # Enable wrapping of discovered plug-ins,
+    # see :func:`register_plugin_wrapper`
+    if _wrap_plugins not in pyblish.api.registered_discovery_filters():
+        pyblish.api.register_discovery_filter(_wrap_plugins)
+
     print("pyblish: Registered %s" % plugin_path)
 
 
+def register_plugin_wrapper(wrapper):
+    """Process each discovered plug-in within `wrapper`
+
+    Applies to plug-ins subclassed from ContextPlugin or InstancePlugin,
+    discovered after :func:`setup`.
+
+    Arguments:
+        wrapper (callable): Called with the plug-in, and the context or
+            instance it is about to process, returning a context manager
+            within which the plug-in is processed.
+
+    Example:
+        >>> @contextlib.contextmanager
+        ... def announce(plugin, subject):
+        ...     print("Processing %s" % plugin.label)
+        ...     yield
+        ...
+        >>> register_plugin_wrapper(announce)
+
+    """
+
+    if wrapper not in self._plugin_wrappers:
+        self._plugin_wrappers.append(wrapper)
+
+
+def deregister_plugin_wrapper(wrapper):
+    """Remove `wrapper` previously registered via register_plugin_wrapper"""
+    if wrapper in self._plugin_wrappers:
+        self._plugin_wrappers.remove(wrapper)
+
+
+def registered_plugin_wrappers():
+    return list(self._plugin_wrappers)
+
+
+def _wrap_plugins(plugins):
+    """Discovery filter, wrapping `process` of each plug-in in-place"""
+    for Plugin in plugins:
+        if not issubclass(Plugin, (pyblish.api.ContextPlugin,
+                                   pyblish.api.InstancePlugin)):
+            continue
+
+        # Directly registered plug-ins are the same class across
+        # discoveries, as are plug-ins inheriting a wrapped process.
+        if getattr(Plugin.process, "_pyblish_maya_wrapped", False):
+            continue
+
+        Plugin.process = _wrapped_process(Plugin.process)
+
+
+def _wrapped_process(process):
+    def _process(plugin, *args, **kwargs):
+        wrappers = list(self._plugin_wrappers)
+        revalidation = self._revalidation
+
+        if not wrappers and revalidation is None:
+            return process(plugin, *args, **kwargs)
+
+        if revalidation is None or not args:
+            return _process_within(wrappers, process, plugin, args, kwargs)
+
+        return revalidation.process(plugin, args[0], lambda: (
+            _process_within(wrappers, process, plugin, args, kwargs)
+        ))
+
+    _process._pyblish_maya_wrapped = True
+    _process.__name__ = process.__name__
+    _process.__doc__ = process.__doc__
+    return _process
+
+
+def _process_within(wrappers, process, plugin, args, kwargs):
+    if not wrappers:
+        return process(plugin, *args, **kwargs)
+
+    with wrappers[0](plugin, *args):
+        return _process_within(wrappers[1:], process, plugin, args, kwargs)
+
+
+def register_performance(evaluation=None):
+    """Publish within :func:`publish_performance`
+
+    The context is entered as the first plug-in is processed, and
+    exited as publishing finishes, as signalled by pyblish, or once
+    Maya is next idle; rather than per plug-in and instance, as
+    switching evaluation mode and restoring time is costly.
+
+    Arguments:
+        evaluation (str, optional): Evaluation mode to use
+            during processing, such as "off" or "serial".
+
+    """
+
+    deregister_performance()
+
+    # Held across plug-ins, so selection is maintained
+    # via the API, rather than by name.
+    @contextlib.contextmanager
+    def wrapper(plugin, subject):
+        if self._performance_context is None:
+            context = publish_performance(evaluation=evaluation, api=True)
+            context.__enter__()
+            self._performance_context = context
+
+            # In case publishing ends without a signal, e.g. from a GUI
+            _defer_idle(_exit_performance)
+
+        yield
+
+    self._performance_wrapper = wrapper
+    register_plugin_wrapper(wrapper)
+
+    for signal in _performance_signals:
+        pyblish.api.register_callback(signal, _exit_performance)
+
+
+def deregister_performance():
+    if self._performance_wrapper is not None:
+        deregister_plugin_wrapper(self._performance_wrapper)
+        self._performance_wrapper = None
+
+        for signal in _performance_signals:
+            pyblish.api.deregister_callback(signal, _exit_performance)
+
+    _exit_performance()
+
+
+# Emitted by pyblish.util once processing finishes
+_performance_signals = (
+    "collected",
+    "validated",
+    "extracted",
+    "integrated",
+    "published",
+)
+
+
+def _exit_performance(**kwargs):
+    context, self._performance_context = self._performance_context, None
+    if context is not None:
+        context.__exit__(None, None, None)
+
+
 def add_to_filemenu():
     """Add Pyblish to file-menu
 
@@ -140,6 +1173,8 @@ def add_to_filemenu():
 
     """
 
+    from maya import mel, cmds
+
     if hasattr(cmds, 'about') and not cmds.about(batch=True):
         # As Maya builds its menus dynamically upon being accessed,
         # we force its build here prior to adding our entry using it's
@@ -157,6 +1192,8 @@ def add_to_filemenu():
 
 
 def remove_from_filemenu():
+    from maya import cmds
+
     for item in ("pyblishOpeningDivider",
                  "pyblishScene",
                  "pyblishCloseDivider"):
@@ -206,9 +1243,17 @@ def _add_to_filemenu():
 
 
 @contextlib.contextmanager
-def maintained_selection():
+def maintained_selection(api=False):
     """Maintain selection during context
 
+    Arguments:
+        api (bool, optional): Capture selection as an OpenMaya
+            MSelectionList and restore it in a single call, rather
+            than by name. Nodes are held by reference, such that
+            renamed nodes are restored too, and large component
+            selections are not expanded into strings. Requires
+            Maya 2012 or above.
+
     Example:
         >>> with maintained_selection():
         ...     # Modify selection
@@ -217,6 +1262,19 @@ def maintained_selection():
 
     """
 
+    if api:
+        import maya.api.OpenMaya as om
+
+        previous_selection = om.MGlobal.getActiveSelectionList()
+        try:
+            yield
+        finally:
+            om.MGlobal.setActiveSelectionList(previous_selection,
+                                              om.MGlobal.kReplaceList)
+        return
+
+    from maya import cmds
+
     previous_selection = cmds.ls(selection=True)
     try:
         yield
@@ -234,6 +1292,8 @@ def maintained_selection():
 def maintained_time():
     """Maintain current time during context
 
+    Time is only restored if changed, as setting it evaluates the scene.
+
     Example:
         >>> with maintained_time():
         ...    cmds.playblast()
@@ -241,120 +1301,528 @@ def maintained_time():
 
     """
 
+    from maya import cmds
+
     ct = cmds.currentTime(query=True)
     try:
         yield
     finally:
-        cmds.currentTime(ct, edit=True)
+        if cmds.currentTime(query=True) != ct:
+            cmds.currentTime(ct, edit=True)
+
+
+def _query_current_file(cmds):
+    current_file = cmds.file(sceneName=True, query=True)
+    if current_file:
+        # Maya returns forward-slashes by default
+        current_file = os.path.normpath(current_file)
+    return current_file
+
+
+def _query_workspace_dir(cmds):
+    workspace = cmds.workspace(rootDirectory=True, query=True)
+    if not workspace:
+        # Project has not been set. Files will
+        # instead end up next to the working file.
+        workspace = cmds.workspace(dir=True, query=True)
+
+    # Maya returns forward-slashes by default
+    return os.path.normpath(workspace)
 
 
-def _show_no_gui():
-    """Popup with information about how to register a new GUI
+_scene_queries = {
+    "currentFile": _query_current_file,
+    "workspaceDir": _query_workspace_dir,
+    "frameRange": lambda cmds: (
+        cmds.playbackOptions(minTime=True, query=True),
+        cmds.playbackOptions(maxTime=True, query=True),
+    ),
+    "timeUnit": lambda cmds: cmds.currentUnit(time=True, query=True),
+    "linearUnit": lambda cmds: cmds.currentUnit(linear=True, query=True),
+    "angularUnit": lambda cmds: cmds.currentUnit(angle=True, query=True),
+}
 
-    In the event of no GUI being registered or available,
-    this information dialog will appear to guide the user
-    through how to get set up with one.
+
+def scene_state(key):
+    """Return `key` of the current scene, querying Maya only when needed
+
+    Values are cached until Maya opens, creates or saves a scene, or
+    changes workspace, playback range or units. Caching only happens
+    while the callbacks of :func:`setup` are registered, otherwise
+    Maya is queried each time.
+
+    Available keys are "currentFile", "workspaceDir", "frameRange",
+    "timeUnit", "linearUnit" and "angularUnit".
+
+    Example:
+        >>> scene_state("currentFile")
+        '/projects/shot01/scenes/shot01_v001.ma'
+
+    Raises:
+        KeyError: If `key` is not one of the above
 
     """
 
-    messagebox = QtWidgets.QMessageBox()
-    messagebox.setIcon(messagebox.Warning)
-    messagebox.setWindowIcon(QtGui.QIcon(os.path.join(
-        os.path.dirname(pyblish.__file__),
-        "icons",
-        "logo-32x32.svg"))
-    )
-
-    spacer = QtWidgets.QWidget()
-    spacer.setMinimumSize(400, 0)
-    spacer.setSizePolicy(QtWidgets.QSizePolicy.Minimum,
-                         QtWidgets.QSizePolicy.Expanding)
-
-    layout = messagebox.layout()
-    layout.addWidget(spacer, layout.rowCount(), 0, 1, layout.columnCount())
-
-    messagebox.setWindowTitle("Uh oh")
-
-    text = "No registered GUI found.\n\n"
-
-    if not pyblish.api.registered_guis():
-        text += (
-            "In order to show you a GUI, one must first be registered. "
-            "\n"
-            "Pyblish supports one or more graphical user interfaces "
-            "to be registered at once, the next acting as a fallback to "
-            "the previous."
-            "\n"
-            "\n"
-            "For example, to use Pyblish Lite, first install it:"
-            "\n"
-            "\n"
-            "$ pip install pyblish-lite"
-            "\n"
-            "\n"
-            "Then register it, like so:"
-            "\n"
-            "\n"
-            ">>> import pyblish.api\n"
-            ">>> pyblish.api.register_gui(\"pyblish_lite\")"
-            "\n"
-            "\n"
-            "The next time you try running this, Lite will appear."
-            "\n"
-            "See http://api.pyblish.com/register_gui.html for "
-            "more information."
-        )
+    try:
+        return self._scene_state[key]
+    except KeyError:
+        pass
+
+    from maya import cmds
+
+    value = _scene_queries[key](cmds)
+
+    if self._callbacks:
+        self._scene_state[key] = value
+
+    return value
+
+
+def hash_file(path, chunk_size=16 * 1024 ** 2):
+    """Return SHA-256 of `path`, hashed at most once per modification
+
+    The file is read via memory-mapping, `chunk_size` bytes at a time,
+    and its hash memoised by path, size and modification time for the
+    remainder of the session.
+
+    """
+
+    return hash_file_async(path, chunk_size, background=False).result()
+
+
+def hash_file_async(path, chunk_size=16 * 1024 ** 2, background=True):
+    """Return Future of SHA-256 of `path`, see :func:`hash_file`
+
+    Arguments:
+        path (str): Absolute path to file
+        chunk_size (int, optional): Bytes read at a time
+        background (bool, optional): Hash on the thread pool of
+            :mod:`pyblish_maya.threads`, rather than right away
+
+    """
+
+    from . import threads
+
+    stat = os.stat(path)
+    key = (stat.st_size, stat.st_mtime)
+
+    try:
+        previous_key, future = self._file_hashes[path]
+    except KeyError:
+        previous_key, future = None, None
+
+    # Failures, such as of a file being written, are tried again
+    if previous_key == key and not (future.done() and
+                                    future.exception() is not None):
+        return future
+
+    if background:
+        future = threads.submit(_hash_file, path, chunk_size)
     else:
-        text += (
-            "None of the registered graphical user interfaces "
-            "could be found."
-            "\n"
-            "These interfaces are currently registered:"
-            "\n"
-            "%s" % "\n".join(pyblish.api.registered_guis())
+        future = threads.Future()
+        future.set_result(_hash_file(path, chunk_size))
+
+    # Only the latest modification of each file is remembered
+    self._file_hashes[path] = (key, future)
+
+    return future
+
+
+def _hash_file(path, chunk_size):
+    import mmap
+    import hashlib
+
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+
+        # Empty files cannot be mapped
+        if size:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for offset in range(0, size, chunk_size):
+                    digest.update(mapped[offset:offset + chunk_size])
+            finally:
+                mapped.close()
+
+    return digest.hexdigest()
+
+
+def current_file_hash(context):
+    """Return SHA-256 of the current file, as collected into `context`
+
+    Waits for hashing started in the background by CollectMayaCurrentFile.
+    Returns None if the hash was not collected.
+
+    """
+
+    if "currentFileHash" not in context.data:
+        future = context.data.get("currentFileHashFuture")
+
+        if future is None:
+            return None
+
+        context.data["currentFileHash"] = future.result()
+
+    return context.data["currentFileHash"]
+
+
+def invalidate_scene_state(*args):
+    """Forget cached scene state, see :func:`scene_state`
+
+    Arguments are ignored, such that this may be used as a callback.
+
+    """
+
+    self._scene_state.clear()
+
+
+@contextlib.contextmanager
+def publish_performance(evaluation=None, api=False):
+    """Maintain selection and time, with refresh and undo suspended
+
+    Viewport refresh and recording of undo are suspended for the
+    duration of the context, and restored on exit; including when
+    an exception is raised. As refresh is suspended, restoring time
+    does not redraw the viewport.
+
+    Refresh is resumed on exit only if it was not already
+    suspended prior to entering, such that nested use keeps
+    it suspended. Likewise, evaluation mode is only switched
+    if it differs from the current mode.
+
+    Arguments:
+        evaluation (str, optional): Evaluation mode to use during
+            context, such as "off" or "serial". Ignored in versions
+            of Maya without the evaluation manager.
+        api (bool, optional): Passed on to :func:`maintained_selection`
+
+    Example:
+        >>> with publish_performance(evaluation="off"):
+        ...     cmds.currentTime(1001)
+        ...     cmds.select("node")
+        >>> # Selection, time, undo and evaluation restored
+
+    """
+
+    from maya import cmds
+
+    undo = cmds.undoInfo(query=True, state=True)
+
+    try:
+        suspended = cmds.refresh(query=True, suspend=True)
+    except (TypeError, RuntimeError):
+        # Not queryable in older versions of Maya
+        suspended = False
+
+    mode = None
+    if evaluation and hasattr(cmds, "evaluationManager"):
+        mode = cmds.evaluationManager(query=True, mode=True)[0]
+
+        # Switching rebuilds the evaluation graph, even to the same mode
+        if mode == evaluation:
+            mode = None
+
+    cmds.refresh(suspend=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+
+    try:
+        if mode is not None:
+            cmds.evaluationManager(mode=evaluation)
+
+        with maintained_selection(api=api):
+            with maintained_time():
+                yield
+
+    finally:
+        if mode is not None:
+            cmds.evaluationManager(mode=mode)
+
+        cmds.undoInfo(stateWithoutFlush=undo)
+        cmds.refresh(suspend=bool(suspended))
+
+
+class Scheduler(object):
+    """Publish in time-sliced steps on Maya's idle queue
+
+    Each step processes plug-in/instance pairs until its time budget
+    is spent, and then yields to Maya, such that the interface stays
+    responsive during long publishes. In batch mode, where there is no
+    idle queue, publishing runs to completion on :meth:`start`.
+
+    Arguments:
+        context (Context, optional): Context to publish, defaults
+            to a new context.
+        plugins (list, optional): Plug-ins to publish with, defaults
+            to those discovered.
+        targets (list, optional): Targets to publish with
+        budget (float, optional): Seconds per step, default 0.05. At least
+            one pair is processed per step, whatever its duration.
+        on_progress (callable, optional): Called with each result,
+            as produced by pyblish.util.publish_iter
+        on_finished (callable, optional): Called with the scheduler once
+            publishing is finished, cancelled or has failed.
+        defer (callable, optional): Called with a function to run once
+            Maya is idle, defaults to evalDeferred at lowest priority.
+
+    Example:
+        >>> def progress(result):
+        ...     print("%d%%" % (result["progress"] * 100))
+        ...
+        >>> scheduler = Scheduler(on_progress=progress)
+        >>> scheduler.start()
+        >>> # Later..
+        >>> scheduler.cancel()
+
+    """
+
+    def __init__(self,
+                 context=None,
+                 plugins=None,
+                 targets=None,
+                 budget=0.05,
+                 on_progress=None,
+                 on_finished=None,
+                 defer=None):
+
+        import pyblish.util
+
+        self.context = context if context is not None else (
+            pyblish.api.Context())
+        self.budget = budget
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+
+        self.finished = False
+        self.cancelled = False
+        self.error = None
+
+        self._defer = defer
+        self._iterator = pyblish.util.publish_iter(
+            self.context, plugins, targets)
+
+    def start(self):
+        """Begin publishing"""
+        if self._defer is None:
+            from maya import cmds
+
+            if hasattr(cmds, "about") and cmds.about(batch=True):
+                while not self.finished:
+                    self.step()
+                return
+
+            self._defer = _defer_idle
+
+        self._defer(self.step)
+
+    def cancel(self):
+        """Stop publishing, prior to processing the next pair"""
+        self.cancelled = True
+
+    def step(self):
+        """Process pairs until the budget is spent, then schedule next step"""
+        if self.finished:
+            return
+
+        if self.cancelled:
+            self._iterator.close()
+            return self._finish()
+
+        start = time.time()
+
+        try:
+            while True:
+                result = next(self._iterator)
+
+                if self.on_progress is not None:
+                    self.on_progress(result)
+
+                if self.cancelled or time.time() - start >= self.budget:
+                    break
+
+        except StopIteration:
+            return self._finish()
+
+        except Exception as e:
+            self.error = e
+            self._finish()
+            raise
+
+        if self._defer is not None:
+            self._defer(self.step)
+
+    def _finish(self):
+        self.finished = True
+
+        if self.on_finished is not None:
+            self.on_finished(self)
+
+
+def _defer_idle(func):
+    from maya import cmds
+    cmds.evalDeferred(func, lowestPriority=True)
+
+
+def publish_deferred(**kwargs):
+    """Start publishing on Maya's idle queue, see :class:`Scheduler`
+
+    Returns:
+        Scheduler: Started scheduler, for progress and cancellation
+
+    """
+
+    scheduler = Scheduler(**kwargs)
+    scheduler.start()
+    return scheduler
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Vectorised readers require NumPy, "
+                          "see https://numpy.org/install")
+    return numpy
+
+
+def _selection(om, nodes):
+    """Return selection of `nodes`, with one item per node, in order
+
+    Raises:
+        ValueError: Should a name match more than one node, such as a
+            wildcard, or a node be listed twice, as these would no
+            longer line up with `nodes`.
+
+    """
+
+    selection = om.MSelectionList()
+    for node in nodes:
+        selection.add(node)
+
+    if selection.length() != len(nodes):
+        raise ValueError(
+            "%d names resolved to %d nodes, each name must "
+            "match a single node, once" % (len(nodes), selection.length())
         )
 
-    messagebox.setText(text)
-    messagebox.setStandardButtons(messagebox.Ok)
-    messagebox.exec_()
+    return selection
+
 
+def _dependency_nodes(om, nodes):
+    """Return MObject of each of `nodes`, resolved in a single call"""
+    selection = _selection(om, nodes)
+    return [selection.getDependNode(index)
+            for index in range(selection.length())]
 
-class Dock(QtWidgets.QWidget):
 
-    def __init__(self, parent=None):
-        super(Dock, self).__init__(parent)
-        QtWidgets.QVBoxLayout(self)
-        self.setObjectName("pyblish_maya.dock")
+def _mesh(om, mesh):
+    selection = om.MSelectionList()
+    selection.add(mesh)
+    return om.MFnMesh(selection.getDagPath(0))
 
 
-def dock(window):
+def read_attribute(nodes, attribute):
+    """Return value of `attribute` across `nodes`, as a NumPy array
 
-    main_window = None
-    for obj in QtWidgets.qApp.topLevelWidgets():
-        if obj.objectName() == "MayaWindow":
-            main_window = obj
+    Numeric attributes produce an array of shape (len(nodes),), and
+    numeric compounds, such as "translate", one of shape
+    (len(nodes), len(children)). Each of `nodes` must name a
+    single node, once, or ValueError is raised.
 
-    if not main_window:
-        raise ValueError("Could not find the main Maya window.")
+    Example:
+        >>> translates = read_attribute(cmds.ls(type="transform"),
+        ...                             "translate")
+        >>> moved = numpy.any(translates != 0, axis=1)
+
+    """
 
-    # Deleting existing dock
-    print("Deleting existing dock...")
-    if self._dock:
-        self._dock.setParent(None)
-        self._dock.deleteLater()
+    numpy = _numpy()
+    import maya.api.OpenMaya as om
 
-    if self._dock_control:
-        if cmds.dockControl(self._dock_control, query=True, exists=True):
-            cmds.deleteUI(self._dock_control)
+    values = list()
+    for obj in _dependency_nodes(om, nodes):
+        plug = om.MFnDependencyNode(obj).findPlug(attribute, False)
 
-    # Creating new dock
-    print("Creating new dock...")
-    dock = Dock(parent=main_window)
+        if plug.isCompound:
+            values.append([plug.child(index).asDouble()
+                           for index in range(plug.numChildren())])
+        else:
+            values.append(plug.asDouble())
+
+    return numpy.array(values, dtype=numpy.float64)
+
+
+def read_points(mesh, world=False):
+    """Return vertex positions of `mesh`, as an array of shape (N, 3)"""
+    numpy = _numpy()
+    import maya.api.OpenMaya as om
+
+    space = om.MSpace.kWorld if world else om.MSpace.kObject
+    points = _mesh(om, mesh).getPoints(space)
+
+    # MPoint is homogeneous, drop w
+    return numpy.array(points, dtype=numpy.float64)[:, :3]
+
+
+def read_normals(mesh, world=False):
+    """Return per-vertex-per-face normals of `mesh`, of shape (N, 3)
+
+    Normals are in face-vertex order, as in the face-vertex
+    listing of each face in turn, N being their total count.
+
+    """
+
+    numpy = _numpy()
+    import maya.api.OpenMaya as om
+
+    space = om.MSpace.kWorld if world else om.MSpace.kObject
+    fn = _mesh(om, mesh)
+
+    # Normals are shared, and indexed per face-vertex
+    normals = numpy.array(fn.getNormals(space), dtype=numpy.float32)
+    _, ids = fn.getNormalIds()
+
+    return normals[numpy.array(ids, dtype=numpy.intp)]
+
+
+def read_uvs(mesh, uv_set=None):
+    """Return UVs of `mesh`, of shape (N, 2), from current or given set"""
+    numpy = _numpy()
+    import maya.api.OpenMaya as om
+
+    fn = _mesh(om, mesh)
+    us, vs = fn.getUVs(uv_set) if uv_set else fn.getUVs()
+
+    return numpy.column_stack((
+        numpy.array(us, dtype=numpy.float32),
+        numpy.array(vs, dtype=numpy.float32),
+    ))
+
+
+def read_matrices(nodes, world=True):
+    """Return transformation matrix of `nodes`, of shape (N, 4, 4)
+
+    Arguments:
+        nodes (list): Names of DAG nodes, each naming a single node, once
+        world (bool, optional): World matrix, rather than local
+
+    """
+
+    numpy = _numpy()
+    import maya.api.OpenMaya as om
+
+    selection = _selection(om, nodes)
+
+    matrices = list()
+    for index in range(selection.length()):
+        path = selection.getDagPath(index)
+
+        if world:
+            matrix = path.inclusiveMatrix()
+        else:
+            matrix = om.MFnTransform(path).transformation().asMatrix()
 
-    dock_control = cmds.dockControl(label=window.windowTitle(), area="right",
-                                    visible=True, content=dock.objectName(),
-                                    allowedArea=["right", "left"])
-    dock.layout().addWidget(window)
+        matrices.append(list(matrix))
 
-    self._dock = dock
-    self._dock_control = dock_control
+    return numpy.array(matrices, dtype=numpy.float64).reshape(-1, 4, 4)
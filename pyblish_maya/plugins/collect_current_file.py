@@ -2,7 +2,16 @@ import pyblish.api
 
 
 class CollectMayaCurrentFile(pyblish.api.ContextPlugin):
-    """Inject the current working file into context"""
+    """Inject the current working file into context
+
+    With the PYBLISH_MAYA_SCENE_HASH environment variable set to "1",
+    the size, modification time and SHA-256 of the file are injected
+    too, as `currentFileSize`, `currentFileMtime` and `currentFileHash`.
+    Set it to "background" to hash on another thread, in which case
+    `currentFileHash` is instead available via
+    `pyblish_maya.lib.current_file_hash(context)`.
+
+    """
 
     order = pyblish.api.CollectorOrder - 0.5
     label = "Maya Current File"
@@ -12,15 +21,31 @@ class CollectMayaCurrentFile(pyblish.api.ContextPlugin):
 
     def process(self, context):
         import os
-        from maya import cmds
+        from pyblish_maya import lib
 
         """Inject the current working file"""
-        current_file = cmds.file(sceneName=True, query=True)
-        if current_file:
-            # Maya returns forward-slashes by default
-            current_file = os.path.normpath(current_file)
+        current_file = lib.scene_state("currentFile")
 
         context.set_data('currentFile', value=current_file)
 
         # For backwards compatibility
         context.set_data('current_file', value=current_file)
+
+        mode = os.environ.get("PYBLISH_MAYA_SCENE_HASH")
+        if mode not in ("1", "background"):
+            return
+
+        if not current_file or not os.path.isfile(current_file):
+            return
+
+        stat = os.stat(current_file)
+        context.data["currentFileSize"] = stat.st_size
+        context.data["currentFileMtime"] = stat.st_mtime
+
+        future = lib.hash_file_async(current_file,
+                                     background=mode == "background")
+
+        if future.done():
+            context.data["currentFileHash"] = future.result()
+        else:
+            context.data["currentFileHashFuture"] = future
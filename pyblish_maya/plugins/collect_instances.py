@@ -0,0 +1,86 @@
+import pyblish.api
+
+
+class CollectMayaInstances(pyblish.api.ContextPlugin):
+    """Inject tagged object sets as instances, in a single pass
+
+    Object sets with a string attribute `id` of "pyblish.maya.instance",
+    or the value of the PYBLISH_MAYA_INSTANCE_ID environment variable,
+    become instances. Each user-defined attribute of a set becomes data
+    of its instance, and each member of the set a member of the instance.
+
+    Sets are found and read through a single iteration of the API, rather
+    than by querying each set and attribute with maya.cmds.
+
+    """
+
+    order = pyblish.api.CollectorOrder
+    label = "Maya Instances"
+
+    hosts = ['maya']
+    version = (0, 1, 0)
+
+    def process(self, context):
+        import os
+        import maya.api.OpenMaya as om
+
+        tag = os.environ.get("PYBLISH_MAYA_INSTANCE_ID",
+                             "pyblish.maya.instance")
+
+        it = om.MItDependencyNodes(om.MFn.kSet)
+        while not it.isDone():
+            node = om.MFnSet(it.thisNode())
+            it.next()
+
+            if not node.hasAttribute("id"):
+                continue
+
+            if node.findPlug("id", False).asString() != tag:
+                continue
+
+            data = dict()
+            for index in range(node.attributeCount()):
+                attr = om.MFnAttribute(node.attribute(index))
+
+                if not attr.dynamic:
+                    continue
+
+                value = _value(om, node.findPlug(attr.object(), False))
+                if value is not None:
+                    data[attr.name] = value
+
+            name = data.pop("subset", node.name())
+            members = node.getMembers(False).getSelectionStrings()
+
+            instance = context.create_instance(name)
+            instance.data.update(data)
+            instance[:] = members
+
+            self.log.debug("Collected %s (%d members)"
+                           % (name, len(members)))
+
+
+def _value(om, plug):
+    """Return value of `plug`, for strings, numbers and enums"""
+    attr = plug.attribute()
+
+    if attr.hasFn(om.MFn.kTypedAttribute):
+        if om.MFnTypedAttribute(attr).attrType() == om.MFnData.kString:
+            return plug.asString()
+
+    elif attr.hasFn(om.MFn.kNumericAttribute):
+        type_ = om.MFnNumericAttribute(attr).numericType()
+
+        if type_ == om.MFnNumericData.kBoolean:
+            return plug.asBool()
+
+        if type_ in (om.MFnNumericData.kFloat, om.MFnNumericData.kDouble):
+            return plug.asDouble()
+
+        if type_ in (om.MFnNumericData.kByte,
+                     om.MFnNumericData.kShort,
+                     om.MFnNumericData.kInt):
+            return plug.asInt()
+
+    elif attr.hasFn(om.MFn.kEnumAttribute):
+        return plug.asShort()
@@ -11,19 +11,11 @@ class CollectMayaWorkspace(pyblish.api.ContextPlugin):
     version = (0, 1, 0)
 
     def process(self, context):
-        import os
-        from maya import cmds
+        from pyblish_maya import lib
 
-        workspace = cmds.workspace(rootDirectory=True, query=True)
-        if not workspace:
-            # Project has not been set. Files will
-            # instead end up next to the working file.
-            workspace = cmds.workspace(dir=True, query=True)
+        workspace = lib.scene_state("workspaceDir")
 
-        # Maya returns forward-slashes by default
-        normalised = os.path.normpath(workspace)
-
-        context.set_data('workspaceDir', value=normalised)
+        context.set_data('workspaceDir', value=workspace)
 
         # For backwards compatibility
-        context.set_data('workspace_dir', value=normalised)
+        context.set_data('workspace_dir', value=workspace)
@@ -0,0 +1,460 @@
+"""Pool of warm mayapy workers
+
+Each worker boots Maya and discovers plug-ins once, and then publishes
+scenes as they are handed to it, avoiding the cost of a cold start
+per publish. Workers are recycled after a number of jobs, or once
+their memory usage exceeds a given size, to keep leaks from building up.
+
+Jobs are submitted either directly, via :class:`Pool`, or by dropping
+files into a queue directory served by :func:`serve`.
+
+Usage:
+    $ mayapy -m pyblish_maya.pool --queue /tmp/publish --workers 4
+    $ mayapy -m pyblish_maya.pool --queue /tmp/publish --submit scene.ma
+
+Queue layout:
+    pending/    Jobs waiting to be published, one JSON file each
+    running/    Jobs currently being published
+    done/       One result record per job, as produced by
+                :func:`pyblish_maya.batch.publish_scene`
+
+"""
+
+import os
+import sys
+import json
+import uuid
+import argparse
+import threading
+import subprocess
+
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+# Tells a worker thread to shut down
+_stop = object()
+
+
+def _rss():
+    """Return resident memory of the current process, in bytes
+
+    Returns 0 where this cannot be determined.
+
+    """
+
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (IOError, OSError, ValueError, IndexError):
+        return 0
+
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class Worker(object):
+    """A single mayapy process, publishing one job at a time
+
+    Arguments:
+        executable (str): Interpreter with which to run the worker,
+            such as mayapy.
+        max_jobs (int, optional): Recycle after this many jobs
+        max_rss (int, optional): Recycle once memory exceeds this
+            many bytes
+
+    """
+
+    def __init__(self, executable, max_jobs=None, max_rss=None):
+        self.executable = executable
+        self.max_jobs = max_jobs
+        self.max_rss = max_rss
+
+        self.jobs = 0
+        self.rss = 0
+        self.recycled = 0
+        self._popen = None
+
+    def start(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (root, env.get("PYTHONPATH")) if p
+        )
+
+        self._popen = subprocess.Popen(
+            [self.executable, "-m", "pyblish_maya.pool", "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            universal_newlines=True,
+        )
+
+        # Wait for Maya to finish booting
+        message = self._read()
+        if not message or not message.get("ready"):
+            self.stop(kill=True)
+            raise RuntimeError("Worker failed to start")
+
+        self.jobs = 0
+        self.rss = message.get("rss", 0)
+
+    def stop(self, kill=False):
+        """Shut down, once the current job is finished
+
+        Arguments:
+            kill (bool, optional): Kill, rather than wait for the job,
+                such as for a worker no longer responding.
+
+        """
+
+        if self._popen is None:
+            return
+
+        if kill:
+            try:
+                self._popen.kill()
+            except OSError:
+                # Already dead
+                pass
+
+        try:
+            self._popen.stdin.close()
+        except (IOError, OSError):
+            pass
+
+        self._popen.wait()
+        self._popen = None
+
+    def process(self, job):
+        """Publish `job` and return its record
+
+        The worker is restarted should it die, or fall out of step with
+        the pool, during the job, and recycled once it exceeds either of
+        its limits.
+
+        """
+
+        if self._popen is None:
+            self.start()
+
+        try:
+            self._popen.stdin.write(json.dumps(job) + "\n")
+            self._popen.stdin.flush()
+            message = self._read()
+        except (IOError, OSError):
+            message = None
+
+        if message is None:
+            self.stop(kill=True)
+            return {
+                "scene": job["scene"],
+                "success": False,
+                "error": "Worker died during publish",
+            }
+
+        self.jobs += 1
+        self.rss = message["rss"]
+
+        if self.should_recycle():
+            self.stop()
+            self.recycled += 1
+
+        return message["record"]
+
+    def should_recycle(self):
+        if self.max_jobs and self.jobs >= self.max_jobs:
+            return True
+
+        if self.max_rss and self.rss >= self.max_rss:
+            return True
+
+        return False
+
+    def _read(self):
+        """Return next message, or None should the worker have died
+
+        Anything but a message, such as output leaking onto the channel,
+        leaves the worker out of sync, and is considered a death too.
+
+        """
+
+        line = self._popen.stdout.readline()
+
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return None
+
+        return message if isinstance(message, dict) else None
+
+
+class Pool(object):
+    """Schedule jobs across a number of warm workers
+
+    Example:
+        >>> pool = Pool(workers=4, max_jobs=50)
+        >>> pool.start()
+        >>> job = pool.submit("/projects/shot01.ma")
+        >>> job_id, record = pool.result()
+        >>> pool.stop()
+
+    Arguments:
+        workers (int, optional): Number of workers, defaults
+            to the number of cores.
+        executable (str, optional): Interpreter used for workers,
+            defaults to the current one.
+        max_jobs (int, optional): Recycle workers after this many jobs
+        max_rss (int, optional): Recycle workers once they exceed
+            this many bytes of resident memory.
+
+    """
+
+    def __init__(self,
+                 workers=None,
+                 executable=None,
+                 max_jobs=None,
+                 max_rss=None):
+
+        if workers is None:
+            import multiprocessing
+            workers = multiprocessing.cpu_count()
+
+        self.workers = [
+            Worker(executable or sys.executable, max_jobs, max_rss)
+            for _ in range(workers)
+        ]
+
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._threads = list()
+
+    def start(self):
+        """Boot all workers, in parallel, and start accepting jobs"""
+        for worker in self.workers:
+            thread = threading.Thread(target=self._run, args=(worker,))
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Finish outstanding jobs and shut down all workers"""
+        for _ in self._threads:
+            self._jobs.put(_stop)
+
+        for thread in self._threads:
+            thread.join()
+
+        self._threads[:] = []
+
+    def submit(self, scene, targets=None, id=None):
+        """Queue `scene` for publishing, returning the id of the job"""
+        job = {
+            "id": id or uuid.uuid4().hex,
+            "scene": scene,
+            "targets": targets,
+        }
+
+        self._jobs.put(job)
+        return job["id"]
+
+    def result(self, timeout=None):
+        """Return the next finished job, as a tuple of (id, record)
+
+        Raises:
+            queue.Empty: If no job finished within `timeout`
+
+        """
+
+        return self._results.get(timeout=timeout)
+
+    def _run(self, worker):
+        try:
+            worker.start()
+        except Exception as e:
+            sys.stderr.write("pyblish: Could not start worker: %s\n" % e)
+
+        while True:
+            job = self._jobs.get()
+
+            if job is _stop:
+                worker.stop()
+                break
+
+            try:
+                record = worker.process(job)
+            except Exception as e:
+                record = {
+                    "scene": job["scene"],
+                    "success": False,
+                    "error": str(e),
+                }
+
+            self._results.put((job["id"], record))
+
+
+def submit(root, scene, targets=None):
+    """Submit `scene` to the queue served at `root`, returning its id"""
+    job = {
+        "id": uuid.uuid4().hex,
+        "scene": os.path.abspath(scene),
+        "targets": targets,
+    }
+
+    pending = os.path.join(root, "pending")
+    if not os.path.isdir(pending):
+        os.makedirs(pending)
+
+    # Write, then rename, such that the server never sees half a job
+    fname = os.path.join(pending, job["id"] + ".json")
+    with open(fname + ".tmp", "w") as f:
+        json.dump(job, f)
+    os.rename(fname + ".tmp", fname)
+
+    return job["id"]
+
+
+def serve(root, pool, interval=0.5):
+    """Publish jobs from the queue directory at `root` until interrupted
+
+    Arguments:
+        root (str): Queue directory, see module docstring for layout
+        pool (Pool): Started pool with which to publish
+        interval (float, optional): Seconds between polls of `root`
+
+    """
+
+    dirs = dict(
+        (name, os.path.join(root, name))
+        for name in ("pending", "running", "done")
+    )
+
+    for path in dirs.values():
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    # Jobs running at the time of a previous shutdown are re-queued
+    for fname in os.listdir(dirs["running"]):
+        os.rename(os.path.join(dirs["running"], fname),
+                  os.path.join(dirs["pending"], fname))
+
+    while True:
+        for fname in sorted(os.listdir(dirs["pending"])):
+            if not fname.endswith(".json"):
+                continue
+
+            running = os.path.join(dirs["running"], fname)
+            os.rename(os.path.join(dirs["pending"], fname), running)
+
+            with open(running) as f:
+                job = json.load(f)
+
+            pool.submit(job["scene"], job.get("targets"), job["id"])
+
+        while True:
+            try:
+                job_id, record = pool.result(timeout=interval)
+            except queue.Empty:
+                break
+
+            with open(os.path.join(dirs["done"], job_id + ".json"), "w") as f:
+                json.dump(record, f)
+
+            os.remove(os.path.join(dirs["running"], job_id + ".json"))
+
+
+def _worker():
+    """Entry point of each worker process
+
+    The original standard out is reserved for communicating with the
+    pool, on a descriptor of its own. Everything else printed, whether
+    by Python, by Maya or by subprocesses, goes to standard error.
+
+    """
+
+    sys.stdout.flush()
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    from . import batch
+
+    import pyblish.api
+
+    batch.initialize()
+    plugins = pyblish.api.discover()
+
+    def send(message):
+        channel.write(json.dumps(message) + "\n")
+        channel.flush()
+
+    send({"ready": True, "rss": _rss()})
+
+    for line in iter(sys.stdin.readline, ""):
+        job = json.loads(line)
+
+        try:
+            record = batch.publish_scene(job["scene"],
+                                         plugins,
+                                         job.get("targets"))
+        except Exception as e:
+            record = {
+                "scene": job["scene"],
+                "success": False,
+                "error": str(e),
+            }
+
+        send({"record": record, "rss": _rss()})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="pyblish_maya.pool",
+                                     description=__doc__.split("\n")[0])
+    parser.add_argument("--queue", help="Queue directory")
+    parser.add_argument("--submit", nargs="+", metavar="SCENE",
+                        help="Submit scenes to queue, and exit")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of workers, defaults to number of cores")
+    parser.add_argument("--executable", default=None,
+                        help="Interpreter for workers, e.g. mayapy")
+    parser.add_argument("--max-jobs", type=int, default=None,
+                        help="Recycle worker after this many jobs")
+    parser.add_argument("--max-rss", type=int, default=None,
+                        help="Recycle worker above this many megabytes")
+    parser.add_argument("--worker", action="store_true",
+                        help=argparse.SUPPRESS)
+
+    opts = parser.parse_args(argv)
+
+    if opts.worker:
+        return _worker()
+
+    if not opts.queue:
+        parser.error("--queue is required")
+
+    if opts.submit:
+        for scene in opts.submit:
+            print(submit(opts.queue, scene))
+        return
+
+    pool = Pool(workers=opts.workers,
+                executable=opts.executable,
+                max_jobs=opts.max_jobs,
+                max_rss=opts.max_rss * 1024 ** 2 if opts.max_rss else None)
+    pool.start()
+
+    sys.stderr.write("pyblish: Serving %s with %d worker(s)\n"
+                     % (opts.queue, len(pool.workers)))
+
+    try:
+        serve(opts.queue, pool)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Per plug-in and instance profiling of a publish
+
+Each plug-in/instance pair processed is recorded with its wall time,
+CPU time and change in peak resident memory. Results are written as
+a Chrome trace, viewable in chrome://tracing or https://ui.perfetto.dev,
+and summarised as the most expensive plug-ins and pairs.
+
+Usage:
+    >>> import pyblish_maya
+    >>> pyblish_maya.setup(profile=True)
+    >>> # Publish..
+    >>> profiler = pyblish_maya.lib.profiler()
+    >>> profiler.write("publish.json")
+    >>> print(profiler.format_summary(top=10))
+
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import contextlib
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+try:
+    _cpu_time = time.process_time
+except AttributeError:
+    # Python 2
+    _cpu_time = time.clock
+
+
+def _peak_rss():
+    """Return peak resident memory of this process, in bytes"""
+    if resource is None:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Profiler(object):
+    """Record the cost of each plug-in/instance pair processed
+
+    Register :meth:`wrapper` via
+    :func:`pyblish_maya.lib.register_plugin_wrapper`
+    to profile discovered plug-ins.
+
+    """
+
+    def __init__(self):
+        self.events = list()
+        self._start = time.time()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self.events[:] = []
+        self._start = time.time()
+
+    @contextlib.contextmanager
+    def wrapper(self, plugin, subject):
+        plugin_name = getattr(plugin, "label", None) or type(plugin).__name__
+        subject_name = getattr(subject, "name", None) or "Context"
+
+        start = time.time()
+        cpu = _cpu_time()
+        rss = _peak_rss()
+
+        try:
+            yield
+        finally:
+            event = {
+                "plugin": plugin_name,
+                "instance": subject_name,
+                "start": start - self._start,
+                "wall": time.time() - start,
+                "cpu": _cpu_time() - cpu,
+                "rss": _peak_rss() - rss,
+                "thread": threading.current_thread().ident,
+            }
+
+            with self._lock:
+                self.events.append(event)
+
+    def chrome_trace(self):
+        """Return events in the Chrome trace event format"""
+        pid = os.getpid()
+
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": "%s (%s)" % (event["plugin"], event["instance"]),
+                    "cat": "pyblish",
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["wall"] * 1e6,
+                    "pid": pid,
+                    "tid": event["thread"],
+                    "args": {
+                        "plugin": event["plugin"],
+                        "instance": event["instance"],
+                        "cpu_ms": event["cpu"] * 1e3,
+                        "peak_rss_delta_bytes": event["rss"],
+                    }
+                }
+                for event in self.events
+            ]
+        }
+
+    def write(self, fname):
+        """Write Chrome trace to `fname`"""
+        with open(fname, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self, top=10):
+        """Return the `top` most expensive plug-ins, and pairs
+
+        Returns:
+            tuple: List of plug-ins and list of plug-in/instance
+                pairs, each a dict sorted by wall time, slowest first.
+
+        """
+
+        plugins = dict()
+        for event in self.events:
+            total = plugins.setdefault(event["plugin"], {
+                "plugin": event["plugin"],
+                "count": 0,
+                "wall": 0.0,
+                "cpu": 0.0,
+                "rss": 0,
+            })
+
+            total["count"] += 1
+            total["wall"] += event["wall"]
+            total["cpu"] += event["cpu"]
+            total["rss"] += event["rss"]
+
+        def by_wall(item):
+            return item["wall"]
+
+        return (
+            sorted(plugins.values(), key=by_wall, reverse=True)[:top],
+            sorted(self.events, key=by_wall, reverse=True)[:top],
+        )
+
+    def format_summary(self, top=10):
+        """Return :meth:`summary` as a human-readable table"""
+        plugins, pairs = self.summary(top)
+
+        lines = ["%-40s %6s %10s %10s %10s" % (
+            "Plug-in", "Count", "Wall (ms)", "CPU (ms)", "RSS (MB)")]
+
+        for total in plugins:
+            lines.append("%-40s %6d %10.1f %10.1f %10.1f" % (
+                total["plugin"][:40], total["count"],
+                total["wall"] * 1e3, total["cpu"] * 1e3,
+                total["rss"] / 1024.0 ** 2))
+
+        lines += ["", "%-60s %10s" % ("Plug-in (Instance)", "Wall (ms)")]
+
+        for event in pairs:
+            name = "%s (%s)" % (event["plugin"], event["instance"])
+            lines.append("%-60s %10.1f" % (name[:60], event["wall"] * 1e3))
+
+        return "\n".join(lines)
@@ -0,0 +1,357 @@
+"""Stream results of a publish to disk, as they are produced
+
+Each result of a plug-in processed is written as a line of JSON,
+optionally compressed and rotated once a file grows beyond a given
+size. Only a bounded summary is kept in memory.
+
+Usage:
+    >>> import pyblish_maya
+    >>> pyblish_maya.setup(results="/tmp/publish.jsonl")
+
+    $ python -m pyblish_maya.sink tail /tmp/publish.jsonl
+    $ python -m pyblish_maya.sink summary /tmp/publish.jsonl
+
+"""
+
+import os
+import sys
+import json
+import time
+import gzip
+import argparse
+import collections
+
+# Leading bytes of a gzip file
+_gzip_magic = b"\x1f\x8b"
+
+
+class ResultSink(object):
+    """Write results to `fname`, one JSON record per line
+
+    Arguments:
+        fname (str): Path of file to write
+        compress (bool, optional): Compress with gzip
+        max_bytes (int, optional): Rotate file beyond this size, such
+            that `fname` is moved to `fname.1`, `fname.1` to `fname.2`
+            and so forth.
+        backups (int, optional): Rotated files to keep, default all
+        trim (bool, optional): Remove each result from the context once
+            written, such that results do not accumulate in memory. Note
+            that graphical user interfaces may rely on these.
+        errors (int, optional): Number of recent errors kept in summary
+
+    """
+
+    def __init__(self,
+                 fname,
+                 compress=False,
+                 max_bytes=None,
+                 backups=None,
+                 trim=False,
+                 errors=20):
+
+        self.fname = fname
+        self.compress = compress
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.trim = trim
+
+        self.summary = {
+            "total": 0,
+            "failed": 0,
+            "duration": 0.0,
+            "plugins": dict(),
+            "errors": collections.deque(maxlen=errors),
+        }
+
+        self._file = None
+
+    def on_processed(self, result):
+        """Callback for pyblish's pluginProcessed signal"""
+        record = serialise(result)
+        self.write(record)
+        self._summarise(record)
+
+        if self.trim:
+            results = result["context"].data.get("results", [])
+            if results and results[-1] is result:
+                results.pop()
+
+    def write(self, record):
+        if self._file is None:
+            self._open()
+
+        self._file.write((json.dumps(record) + "\n").encode("utf-8"))
+        self._file.flush()
+
+        if self.max_bytes and os.path.getsize(self.fname) >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self):
+        self.close()
+
+        index = 1
+        while os.path.exists("%s.%d" % (self.fname, index)):
+            index += 1
+
+        for index in range(index - 1, 0, -1):
+            src = "%s.%d" % (self.fname, index)
+
+            if self.backups is not None and index >= self.backups:
+                os.remove(src)
+            else:
+                os.rename(src, "%s.%d" % (self.fname, index + 1))
+
+        if self.backups != 0:
+            os.rename(self.fname, self.fname + ".1")
+        else:
+            os.remove(self.fname)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self):
+        dirname = os.path.dirname(self.fname)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+
+        if self.compress:
+            self._file = gzip.open(self.fname, "ab")
+        else:
+            self._file = open(self.fname, "ab")
+
+    def _summarise(self, record):
+        summary = self.summary
+        summary["total"] += 1
+        summary["duration"] += record["duration"] or 0
+
+        counts = summary["plugins"].setdefault(record["plugin"], [0, 0])
+        counts[0] += 1
+
+        if not record["success"]:
+            counts[1] += 1
+            summary["failed"] += 1
+            summary["errors"].append(record)
+
+
+def serialise(result):
+    """Return JSON-compatible record of pyblish `result`"""
+    plugin = result["plugin"]
+    instance = result["instance"]
+    error = result["error"]
+
+    return {
+        "time": time.time(),
+        "plugin": plugin.__name__,
+        "label": getattr(plugin, "label", None) or plugin.__name__,
+        "instance": instance.name if instance is not None else None,
+        "success": result["success"],
+        "duration": result["duration"],
+        "error": str(error) if error is not None else None,
+        "traceback": getattr(error, "formatted_traceback", None),
+        "records": [
+            {"level": record.levelname, "message": record.getMessage()}
+            for record in result["records"]
+        ],
+    }
+
+
+def _files(fname):
+    """Return rotated files of `fname`, oldest first, followed by `fname`"""
+    files = list()
+
+    index = 1
+    while os.path.exists("%s.%d" % (fname, index)):
+        files.insert(0, "%s.%d" % (fname, index))
+        index += 1
+
+    if os.path.exists(fname):
+        files.append(fname)
+
+    return files
+
+
+def _open(fname):
+    with open(fname, "rb") as f:
+        compressed = f.read(2) == _gzip_magic
+
+    return gzip.open(fname, "rb") if compressed else open(fname, "rb")
+
+
+def read(fname):
+    """Yield each record of `fname`, including rotated files
+
+    A record cut short, such as by a crash, ends reading of its file.
+
+    """
+
+    for path in _files(fname):
+        for record in _read(path):
+            yield record
+
+
+def _read(path):
+    f = _open(path)
+    try:
+        for line in f:
+            try:
+                yield json.loads(line.decode("utf-8"))
+            except ValueError:
+                break
+    except (EOFError, IOError):
+        # Compressed stream cut short
+        pass
+    finally:
+        f.close()
+
+
+def follow(fname, interval=0.5):
+    """Yield each record of `fname`, then each record as it is written
+
+    Only uncompressed files may be followed. A record is yielded once
+    written in full, and reading continues into the next file once
+    `fname` is rotated. Runs until interrupted.
+
+    """
+
+    for path in _files(fname):
+        if path != fname:
+            for record in _read(path):
+                yield record
+
+    f = None
+    partial = b""
+
+    try:
+        while True:
+            if f is None:
+                try:
+                    f = open(fname, "rb")
+                except (IOError, OSError):
+                    # Not yet written, or being rotated
+                    time.sleep(interval)
+                    continue
+
+                if f.read(2) == _gzip_magic:
+                    raise ValueError("Compressed files cannot be followed")
+
+                f.seek(0)
+                partial = b""
+
+            chunk = f.read()
+
+            if chunk:
+                lines = (partial + chunk).split(b"\n")
+
+                # The last line is incomplete, until followed by a newline
+                partial = lines.pop()
+
+                for line in lines:
+                    try:
+                        record = json.loads(line.decode("utf-8"))
+                    except ValueError:
+                        # Corrupt, such as by a crashed writer
+                        continue
+
+                    yield record
+
+            elif _rotated(f, fname):
+                # Everything written before rotation has been read
+                f.close()
+                f = None
+
+            else:
+                time.sleep(interval)
+
+    finally:
+        if f is not None:
+            f.close()
+
+
+def _rotated(f, fname):
+    """Return whether `fname` is no longer the file open as `f`"""
+    try:
+        return os.stat(fname).st_ino != os.fstat(f.fileno()).st_ino
+    except OSError:
+        return True
+
+
+def aggregate(records):
+    """Return summary of `records`, per plug-in"""
+    summary = {
+        "total": 0,
+        "failed": 0,
+        "duration": 0.0,
+        "plugins": dict(),
+    }
+
+    for record in records:
+        summary["total"] += 1
+        summary["duration"] += record["duration"] or 0
+
+        plugin = summary["plugins"].setdefault(record["plugin"], {
+            "count": 0,
+            "failed": 0,
+            "duration": 0.0,
+        })
+
+        plugin["count"] += 1
+        plugin["duration"] += record["duration"] or 0
+
+        if not record["success"]:
+            plugin["failed"] += 1
+            summary["failed"] += 1
+
+    return summary
+
+
+def _format(record):
+    return "%s %-40s %-30s %8.1fms %s" % (
+        time.strftime("%H:%M:%S", time.localtime(record["time"])),
+        record["label"][:40],
+        (record["instance"] or "Context")[:30],
+        record["duration"] or 0,
+        "ERROR: %s" % record["error"] if record["error"] else "",
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="pyblish_maya.sink",
+                                     description=__doc__.split("\n")[0])
+    parser.add_argument("command", choices=["tail", "summary"])
+    parser.add_argument("fname")
+    parser.add_argument("--follow", "-f", action="store_true",
+                        help="Keep reading records as they are written")
+
+    opts = parser.parse_args(argv)
+
+    if opts.command == "tail":
+        records = follow(opts.fname) if opts.follow else read(opts.fname)
+
+        try:
+            for record in records:
+                print(_format(record))
+        except KeyboardInterrupt:
+            pass
+
+        return 0
+
+    summary = aggregate(read(opts.fname))
+
+    print("%-40s %8s %8s %12s" % ("Plug-in", "Count", "Failed", "Time (ms)"))
+    for name, plugin in sorted(summary["plugins"].items(),
+                               key=lambda item: item[1]["duration"],
+                               reverse=True):
+        print("%-40s %8d %8d %12.1f" % (
+            name[:40], plugin["count"], plugin["failed"], plugin["duration"]))
+
+    print("\n%d results, %d failed, %.1f ms" % (
+        summary["total"], summary["failed"], summary["duration"]))
+
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
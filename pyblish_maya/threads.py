@@ -0,0 +1,305 @@
+"""Overlap file I/O across instances, keeping Maya on the main thread
+
+Work submitted via :func:`submit` runs on a shared, bounded pool of
+threads. Functions running there may call Maya through
+:func:`call_in_main_thread`, which hands the call to the main thread
+and waits for its result. The main thread runs those calls whilst
+waiting on results, via :func:`wait`, :func:`as_completed` or
+:meth:`Future.result`.
+
+Example:
+    >>> from maya import cmds
+    >>> def extract(instance, path):
+    ...     members = call_in_main_thread(cmds.sets, instance, query=True)
+    ...     with open(path, "w") as f:
+    ...         f.write("\\n".join(members))
+    ...
+    >>> futures = [submit(extract, name, name + ".txt")
+    ...            for name in ("set1", "set2")]
+    >>> wait(futures)
+
+"""
+
+import os
+import sys
+import time
+import threading
+
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+self = sys.modules[__name__]
+self._pool = None
+self._lock = threading.Lock()
+
+# Calls waiting to be run on the main thread
+self._main_calls = queue.Queue()
+
+# Seconds between checks for calls, whilst waiting
+_poll_interval = 0.005
+
+# Tells a worker thread to shut down
+_stop = object()
+
+
+def _is_main_thread():
+    return isinstance(threading.current_thread(), threading._MainThread)
+
+
+class Future(object):
+    """Result of a function, run elsewhere"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._error = None
+
+    def done(self):
+        return self._event.is_set()
+
+    def set_result(self, result):
+        self._result = result
+        self._event.set()
+
+    def set_exception(self, error):
+        self._error = error
+        self._event.set()
+
+    def exception(self, timeout=None):
+        """Return error raised by function, or None
+
+        On the main thread, calls from other threads are run whilst waiting.
+
+        Raises:
+            RuntimeError: If not done within `timeout`
+
+        """
+
+        if not self._wait(timeout):
+            raise RuntimeError("Timed out")
+
+        return self._error
+
+    def result(self, timeout=None):
+        """Return result of function, re-raising any error
+
+        On the main thread, calls from other threads are run whilst waiting.
+
+        Raises:
+            RuntimeError: If not done within `timeout`
+
+        """
+
+        error = self.exception(timeout)
+
+        if error is not None:
+            raise error
+
+        return self._result
+
+    def _wait(self, timeout):
+        if not _is_main_thread():
+            self._event.wait(timeout)
+            return self._event.is_set()
+
+        deadline = None if timeout is None else time.time() + timeout
+
+        while not self._event.is_set():
+            remaining = None if deadline is None else deadline - time.time()
+
+            if remaining is not None and remaining <= 0:
+                return False
+
+            process_main_thread_calls(
+                timeout=min(_poll_interval, remaining or _poll_interval)
+            )
+
+        return True
+
+
+def _run(future, func, args, kwargs):
+    try:
+        result = func(*args, **kwargs)
+    except BaseException as e:
+        # Including SystemExit and KeyboardInterrupt, such that
+        # whoever waits on `future` is told, rather than left waiting.
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+
+
+class ThreadPool(object):
+    """Bounded pool of threads
+
+    Arguments:
+        workers (int): Number of threads
+        queue_size (int, optional): Maximum number of pending functions,
+            beyond which :meth:`submit` waits. Defaults to 4 per thread.
+
+    """
+
+    def __init__(self, workers, queue_size=None):
+        self._queue = queue.Queue(queue_size or workers * 4)
+        self._threads = list()
+
+        for _ in range(workers):
+            thread = threading.Thread(target=self._work)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, func, *args, **kwargs):
+        """Run `func` with `args` and `kwargs` on the pool
+
+        Returns:
+            Future: Result of `func`
+
+        """
+
+        future = Future()
+        self._put((future, func, args, kwargs))
+        return future
+
+    def shutdown(self, wait=True):
+        """Stop threads once pending functions have run"""
+        for _ in self._threads:
+            self._put(_stop)
+
+        if wait:
+            for thread in self._threads:
+                while thread.is_alive():
+                    # Pending functions may call on the main thread
+                    if _is_main_thread():
+                        process_main_thread_calls(timeout=_poll_interval)
+                    thread.join(_poll_interval)
+
+        self._threads[:] = []
+
+    def _put(self, item):
+        if not _is_main_thread():
+            return self._queue.put(item)
+
+        # Whilst the queue is full, threads may be
+        # waiting on the main thread to free up room.
+        while True:
+            try:
+                return self._queue.put(item, timeout=_poll_interval)
+            except queue.Full:
+                process_main_thread_calls()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+
+            if item is _stop:
+                break
+
+            _run(*item)
+
+
+def pool():
+    """Return the shared pool, creating it on first call
+
+    The number of threads is taken from the PYBLISH_MAYA_THREADS
+    environment variable, defaulting to the number of cores, up to 8.
+
+    """
+
+    with self._lock:
+        if self._pool is None:
+            import multiprocessing
+
+            workers = int(os.environ.get(
+                "PYBLISH_MAYA_THREADS",
+                min(8, multiprocessing.cpu_count())
+            ))
+
+            self._pool = ThreadPool(workers)
+
+    return self._pool
+
+
+def submit(func, *args, **kwargs):
+    """Run `func` on the shared pool, see :class:`ThreadPool`"""
+    return pool().submit(func, *args, **kwargs)
+
+
+def call_in_main_thread(func, *args, **kwargs):
+    """Run `func` on the main thread, and return its result
+
+    Blocks until the main thread runs it, whilst waiting on results.
+    Called from the main thread, `func` is run immediately.
+
+    """
+
+    if _is_main_thread():
+        return func(*args, **kwargs)
+
+    future = Future()
+    self._main_calls.put((future, func, args, kwargs))
+    return future.result()
+
+
+def process_main_thread_calls(timeout=0):
+    """Run calls made via :func:`call_in_main_thread`
+
+    Must be called from the main thread.
+
+    Arguments:
+        timeout (float, optional): Seconds to wait for a first call
+
+    Returns:
+        int: Number of calls run
+
+    """
+
+    count = 0
+
+    while True:
+        try:
+            if count or not timeout:
+                item = self._main_calls.get_nowait()
+            else:
+                item = self._main_calls.get(timeout=timeout)
+        except queue.Empty:
+            return count
+
+        _run(*item)
+        count += 1
+
+
+def wait(futures, timeout=None):
+    """Wait for all `futures`, running calls on the main thread meanwhile
+
+    Returns:
+        list: Result of each future, in order
+
+    """
+
+    deadline = None if timeout is None else time.time() + timeout
+
+    return [
+        future.result(
+            None if deadline is None else max(0, deadline - time.time())
+        )
+        for future in futures
+    ]
+
+
+def as_completed(futures):
+    """Yield `futures` as they finish, running calls on the main thread"""
+    pending = list(futures)
+
+    while pending:
+        for future in list(pending):
+            if future.done():
+                pending.remove(future)
+                yield future
+
+        if pending and _is_main_thread():
+            process_main_thread_calls(timeout=_poll_interval)
+        elif pending:
+            time.sleep(_poll_interval)
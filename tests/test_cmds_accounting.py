@@ -0,0 +1,99 @@
+"""Accounting of maya.cmds, against a stand-in cmds and without Maya"""
+
+import sys
+import types
+
+import pyblish.api
+import pyblish.util
+
+from pyblish_maya import lib
+
+
+class ValidateWithCmds(pyblish.api.ContextPlugin):
+    order = pyblish.api.ValidatorOrder
+
+    def process(self, context):
+        from maya import cmds
+        cmds.ls(type="mesh")
+        cmds.getAttr("node.translateX")
+        cmds.getAttr("node.translateX")
+
+
+def _cmds():
+    cmds = types.ModuleType("stand_in_cmds")
+    cmds.ls = lambda *args, **kwargs: ["node"]
+    cmds.getAttr = lambda plug, **kwargs: 0.0
+    return cmds
+
+
+def _publish():
+    lib._wrap_plugins([ValidateWithCmds])
+    context = pyblish.util.publish(plugins=[ValidateWithCmds])
+
+    for result in context.data["results"]:
+        assert result["success"], result["error"]
+
+
+def setup_function(function):
+    lib.deregister_cmds_accounting()
+
+
+def teardown_function(function):
+    lib.deregister_cmds_accounting()
+
+
+def test_accounts_without_maya():
+    """from maya import cmds finds the proxy, without a maya package"""
+    assert "maya" not in sys.modules
+
+    accounting = lib.register_cmds_accounting(_cmds())
+    _publish()
+
+    assert accounting.commands["ls"][0] == 1
+    assert accounting.commands["getAttr"][0] == 2
+    assert accounting.plugins[("ValidateWithCmds", "getAttr")][0] == 2
+
+    # Read-only commands are queries, without a query flag
+    repeated = accounting.repeated_queries()
+    assert len(repeated) == 1
+    assert repeated[0][0] == "getAttr"
+    assert repeated[0][3] == 2
+
+    # Stand-in package is removed again
+    assert "maya" not in sys.modules
+    assert "maya.cmds" not in sys.modules
+
+
+def test_restores_absent_cmds():
+    """Names absent before processing are removed, rather than set to None"""
+    maya = sys.modules["maya"] = types.ModuleType("maya")
+
+    try:
+        accounting = lib.register_cmds_accounting(_cmds())
+        _publish()
+
+        assert accounting.commands["ls"][0] == 1
+        assert "maya.cmds" not in sys.modules
+        assert not hasattr(maya, "cmds")
+        assert sys.modules["maya"] is maya
+
+    finally:
+        sys.modules.pop("maya", None)
+
+
+def test_restores_present_cmds():
+    """Existing maya.cmds is put back once processed"""
+    cmds = _cmds()
+    maya = sys.modules["maya"] = types.ModuleType("maya")
+    maya.cmds = sys.modules["maya.cmds"] = cmds
+
+    try:
+        lib.register_cmds_accounting(cmds)
+        _publish()
+
+        assert sys.modules["maya.cmds"] is cmds
+        assert maya.cmds is cmds
+
+    finally:
+        sys.modules.pop("maya", None)
+        sys.modules.pop("maya.cmds", None)
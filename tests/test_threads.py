@@ -0,0 +1,117 @@
+"""Thread pool and main-thread marshalling, with pytest as the main thread
+
+The thread running the tests stands in for Maya's main thread,
+running calls made via call_in_main_thread whilst it waits.
+
+"""
+
+import threading
+
+from pyblish_maya import threads
+
+# Seconds after which a test is considered deadlocked
+_timeout = 10
+
+
+def _main_thread():
+    return threads._is_main_thread()
+
+
+def test_call_in_main_thread_order():
+    """Calls run on the main thread, in the order they were made"""
+    pool = threads.ThreadPool(1)
+    calls = list()
+
+    def work(index):
+        for part in range(3):
+            assert not _main_thread()
+            threads.call_in_main_thread(
+                lambda: calls.append((index, part, _main_thread()))
+            )
+        return index
+
+    futures = [pool.submit(work, index) for index in range(5)]
+
+    assert threads.wait(futures, timeout=_timeout) == list(range(5))
+    assert calls == [
+        (index, part, True) for index in range(5) for part in range(3)
+    ]
+
+    pool.shutdown()
+
+
+def test_call_in_main_thread_from_main_thread():
+    """On the main thread, calls run immediately"""
+    assert threads.call_in_main_thread(_main_thread) is True
+
+
+def test_submit_to_full_queue():
+    """Submitting to a full queue runs main-thread calls meanwhile"""
+    pool = threads.ThreadPool(1, queue_size=1)
+
+    def work(index):
+        # Occupies the only thread until the main thread answers
+        return threads.call_in_main_thread(lambda: index * 2)
+
+    # More than the thread and queue can hold, whilst
+    # the thread waits on the main thread.
+    futures = [pool.submit(work, index) for index in range(10)]
+
+    assert threads.wait(futures, timeout=_timeout) == [
+        index * 2 for index in range(10)
+    ]
+
+    pool.shutdown()
+
+
+def test_shutdown_with_pending_main_thread_calls():
+    """Shutting down runs pending functions, and their main-thread calls"""
+    pool = threads.ThreadPool(2)
+    ran = list()
+
+    def work(index):
+        threads.call_in_main_thread(ran.append, index)
+        return index
+
+    futures = [pool.submit(work, index) for index in range(8)]
+    pool.shutdown(wait=True)
+
+    assert all(future.done() for future in futures)
+    assert [future.result(0) for future in futures] == list(range(8))
+    assert sorted(ran) == list(range(8))
+
+
+def test_errors():
+    """Errors are raised on wait, including those of main-thread calls"""
+    pool = threads.ThreadPool(1)
+
+    def work():
+        threads.call_in_main_thread(lambda: 1 / 0)
+
+    future = pool.submit(work)
+
+    try:
+        threads.wait([future], timeout=_timeout)
+    except ZeroDivisionError:
+        pass
+    else:
+        assert False, "ZeroDivisionError not raised"
+
+    pool.shutdown()
+
+
+def test_base_exception():
+    """A BaseException fails its future, rather than leaving it waiting"""
+    pool = threads.ThreadPool(1)
+
+    def work():
+        raise SystemExit(1)
+
+    future = pool.submit(work)
+    assert isinstance(future.exception(_timeout), SystemExit)
+
+    # The thread lives on
+    thread = pool.submit(threading.current_thread).result(_timeout)
+    assert thread in pool._threads
+
+    pool.shutdown()